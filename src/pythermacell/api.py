@@ -93,6 +93,8 @@ class ThermacellAPI:
         self._session = session
         self._owns_session = session is None
         self._base_url = base_url.rstrip("/")
+        # Versioned API root, joined once so requests only append the endpoint
+        self._api_root = f"{self._base_url}/v1"
 
         # Store resilience patterns
         self._circuit_breaker = circuit_breaker
@@ -198,7 +200,7 @@ class ThermacellAPI:
         # Ensure we're authenticated
         await self._auth_handler.ensure_authenticated()
 
-        url = f"{self._base_url}/v1{endpoint}"
+        url = self._api_root + endpoint
         headers = {"Authorization": self._auth_handler.access_token or ""}
         timeout = ClientTimeout(total=DEFAULT_TIMEOUT)
 
@@ -6,6 +6,7 @@ import asyncio
 import base64
 import json
 import logging
+import time
 from datetime import UTC, datetime
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
@@ -112,6 +113,8 @@ class AuthenticationHandler:
         self._auth_lock = asyncio.Lock()
         self._on_session_updated = on_session_updated
         self._auth_lifetime_seconds = auth_lifetime_seconds
+        # Monotonic deadline after which tokens are treated as expired
+        self._auth_expires_at: float | None = None
         self._circuit_breaker = circuit_breaker
         self._backoff = backoff
         self._rate_limiter = rate_limiter
@@ -257,12 +260,39 @@ class AuthenticationHandler:
             _LOGGER.debug("Skipping authentication - valid tokens already exist")
             return True
 
+        return await self._login(reuse_valid_tokens=not force)
+
+    async def _login(self, *, reuse_valid_tokens: bool) -> bool:
+        """Log in, applying the circuit breaker, auth lock and retry policy.
+
+        Shared by authenticate() and force_reauthenticate(); callers are
+        responsible for validating the session and any token-validity check.
+
+        Args:
+            reuse_valid_tokens: If True, return early when a concurrent caller
+                refreshed the tokens while this one waited for the lock.
+
+        Returns:
+            True if authentication was successful.
+
+        Raises:
+            AuthenticationError: If authentication fails.
+            ThermacellTimeoutError: If the request times out.
+            ThermacellConnectionError: If a connection error occurs.
+            RuntimeError: If circuit breaker is open.
+        """
         # Check circuit breaker before attempting
         if self._circuit_breaker is not None and not self._circuit_breaker.can_execute():
             msg = "Circuit breaker is open - authentication requests are blocked"
             raise RuntimeError(msg)
 
         async with self._auth_lock:
+            # Concurrent callers queue on the lock; once the first one has
+            # logged in, the rest reuse its tokens instead of posting again.
+            if reuse_valid_tokens and not self.needs_reauthentication():
+                _LOGGER.debug("Skipping authentication - tokens refreshed by a concurrent caller")
+                return True
+
             # Determine max retries from backoff config
             max_attempts = 1
             if self._backoff is not None:
@@ -298,7 +328,7 @@ class AuthenticationHandler:
                                 delay,
                                 exc,
                             )
-                            await asyncio.sleep(delay)
+                            await self._backoff.sleep(delay)
                         else:
                             _LOGGER.warning("Authentication attempt %d failed: %s", attempt + 1, exc)
                     else:
@@ -378,6 +408,7 @@ class AuthenticationHandler:
 
                 # Track when authentication occurred
                 self.last_authenticated_at = datetime.now(UTC)
+                self._auth_expires_at = time.monotonic() + self._auth_lifetime_seconds
 
                 _LOGGER.info("Authentication successful for user %s", self.user_id)
 
@@ -434,7 +465,8 @@ class AuthenticationHandler:
             ConnectionError: If a connection error occurs.
         """
         _LOGGER.info("Forcing reauthentication")
-        return await self.authenticate(force=True)
+        self._validate_session()
+        return await self._login(reuse_valid_tokens=False)
 
     def needs_reauthentication(self) -> bool:
         """Check if reauthentication may be needed.
@@ -445,15 +477,11 @@ class AuthenticationHandler:
         Returns:
             True if reauthentication may be needed, False otherwise.
         """
-        if not self.is_authenticated():
-            return True
-
-        if self.last_authenticated_at is None:
+        if not self.is_authenticated() or self._auth_expires_at is None:
             return True
 
-        # Check if auth is older than the configured lifetime
-        time_since_auth = (datetime.now(UTC) - self.last_authenticated_at).total_seconds()
-        return time_since_auth >= self._auth_lifetime_seconds
+        # Deadline is computed once per login, so this is a single clock compare
+        return time.monotonic() >= self._auth_expires_at
 
     def clear_authentication(self) -> None:
         """Clear all authentication state.
@@ -465,6 +493,7 @@ class AuthenticationHandler:
         self.access_token = None
         self.user_id = None
         self.last_authenticated_at = None
+        self._auth_expires_at = None
         _LOGGER.debug("Authentication state cleared")
 
     def should_retry_on_status(self, status_code: int) -> bool:
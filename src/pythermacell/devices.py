@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+from dataclasses import replace
 from datetime import UTC, datetime
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, cast
@@ -304,13 +305,14 @@ class ThermacellDevice:
         old_enable_repellers = self._state.params.enable_repellers
         old_led_power = self._state.params.led_power
 
-        # Optimistic update: Update local state immediately
-        self._state.params.enable_repellers = power_on
-        self._state.params.power = power_on  # Update read-only status too
-
-        # Recalculate LED power based on new device power
+        # Optimistic update: Update local state immediately,
+        # recalculating LED power based on new device power
         brightness = self._state.params.led_brightness or 0
-        self._state.params.led_power = power_on and brightness > 0
+        self._replace_params(
+            enable_repellers=power_on,
+            power=power_on,  # Update read-only status too
+            led_power=power_on and brightness > 0,
+        )
 
         # Notify listeners immediately (instant UI update)
         self._notify_listeners()
@@ -332,9 +334,11 @@ class ThermacellDevice:
 
         # Revert on failure
         if not success:
-            self._state.params.enable_repellers = old_enable_repellers
-            self._state.params.power = old_enable_repellers
-            self._state.params.led_power = old_led_power
+            self._replace_params(
+                enable_repellers=old_enable_repellers,
+                power=old_enable_repellers,
+                led_power=old_led_power,
+            )
             self._notify_listeners()  # Notify of reversion
 
         return success
@@ -375,12 +379,9 @@ class ThermacellDevice:
         old_brightness = self._state.params.led_brightness
         old_led_power = self._state.params.led_power
 
-        # Optimistic update
-        self._state.params.led_brightness = brightness
-
-        # Recalculate LED power state (device must be on AND brightness > 0)
+        # Optimistic update, recalculating LED power state (device must be on AND brightness > 0)
         device_powered = self._state.params.enable_repellers or False
-        self._state.params.led_power = device_powered and brightness > 0
+        self._replace_params(led_brightness=brightness, led_power=device_powered and brightness > 0)
 
         # Notify listeners
         self._notify_listeners()
@@ -402,8 +403,7 @@ class ThermacellDevice:
 
         # Revert on failure
         if not success:
-            self._state.params.led_brightness = old_brightness
-            self._state.params.led_power = old_led_power
+            self._replace_params(led_brightness=old_brightness, led_power=old_led_power)
             self._notify_listeners()
 
         return success
@@ -440,13 +440,9 @@ class ThermacellDevice:
         old_brightness = self._state.params.led_brightness
         old_led_power = self._state.params.led_power
 
-        # Optimistic update
-        self._state.params.led_hue = hue
-        self._state.params.led_brightness = brightness
-
-        # Recalculate LED power state
+        # Optimistic update, recalculating LED power state
         device_powered = self._state.params.enable_repellers or False
-        self._state.params.led_power = device_powered and brightness > 0
+        self._replace_params(led_hue=hue, led_brightness=brightness, led_power=device_powered and brightness > 0)
 
         # Notify listeners
         self._notify_listeners()
@@ -473,9 +469,7 @@ class ThermacellDevice:
 
         # Revert on failure
         if not success:
-            self._state.params.led_hue = old_hue
-            self._state.params.led_brightness = old_brightness
-            self._state.params.led_power = old_led_power
+            self._replace_params(led_hue=old_hue, led_brightness=old_brightness, led_power=old_led_power)
             self._notify_listeners()
 
         return success
@@ -503,7 +497,7 @@ class ThermacellDevice:
         old_refill_life = self._state.params.refill_life
 
         # Optimistic update: Set to 100%
-        self._state.params.refill_life = 100.0
+        self._replace_params(refill_life=100.0)
         self._notify_listeners()
 
         # Use "Refill Reset" parameter with cartridge type value
@@ -512,11 +506,22 @@ class ThermacellDevice:
 
         # Revert on failure
         if not success:
-            self._state.params.refill_life = old_refill_life
+            self._replace_params(refill_life=old_refill_life)
             self._notify_listeners()
 
         return success
 
+    def _replace_params(self, **changes: Any) -> None:
+        """Apply parameter changes to the local state.
+
+        The state models are frozen, so this swaps in a copy of the current
+        state whose params carry the changes.
+
+        Args:
+            **changes: DeviceParams fields to overwrite.
+        """
+        self._state = replace(self._state, params=replace(self._state.params, **changes))
+
     async def _update_params(self, params: dict[str, dict[str, int | float | bool]]) -> bool:
         """Update device parameters via API.
 
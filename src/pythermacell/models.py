@@ -18,7 +18,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoginResponse:
     """Response from authentication endpoint.
 
@@ -33,7 +33,7 @@ class LoginResponse:
     user_id: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceInfo:
     """Device information from config endpoint.
 
@@ -52,7 +52,7 @@ class DeviceInfo:
     serial_number: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceStatus:
     """Device connectivity status.
 
@@ -65,7 +65,7 @@ class DeviceStatus:
     connected: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceParams:
     """Device parameter state from params endpoint.
 
@@ -96,7 +96,7 @@ class DeviceParams:
     enable_repellers: bool | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceState:
     """Complete device state combining info, status, and parameters.
 
@@ -128,7 +128,7 @@ class DeviceState:
         return (self.params.error or 0) > 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Group:
     """Group information for device organization.
 
@@ -147,7 +147,7 @@ class Group:
     total: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GroupListResponse:
     """Response from groups list endpoint.
 
@@ -160,7 +160,7 @@ class GroupListResponse:
     total: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GroupNodesResponse:
     """Response from group nodes endpoint.
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
@@ -110,6 +111,8 @@ class CircuitBreaker:
         recovery_timeout: float = 60.0,
         success_threshold: int = 2,
         monitored_exceptions: tuple[type[Exception], ...] = (Exception,),
+        *,
+        time_func: Callable[[], float] = time.monotonic,
     ) -> None:
         """Initialize circuit breaker.
 
@@ -118,6 +121,8 @@ class CircuitBreaker:
             recovery_timeout: Seconds before attempting recovery.
             success_threshold: Consecutive successes to close circuit from half-open.
             monitored_exceptions: Exception types to monitor.
+            time_func: Monotonic clock used to measure the recovery timeout.
+                Defaults to time.monotonic; tests may inject a fake clock.
         """
         self.config = CircuitBreakerConfig(
             failure_threshold=failure_threshold,
@@ -128,8 +133,9 @@ class CircuitBreaker:
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._success_count = 0
+        self._time_func = time_func
         self._last_failure_time: datetime | None = None
-        self._opened_at: datetime | None = None
+        self._opened_at: float | None = None
 
     @property
     def state(self) -> CircuitState:
@@ -150,7 +156,7 @@ class CircuitBreaker:
     def _update_state(self) -> None:
         """Update circuit state based on recovery timeout."""
         if self._state == CircuitState.OPEN and self._opened_at is not None:
-            time_open = (datetime.now(UTC) - self._opened_at).total_seconds()
+            time_open = self._time_func() - self._opened_at
             if time_open >= self.config.recovery_timeout:
                 _LOGGER.info("Circuit breaker entering HALF_OPEN state for recovery test")
                 self._state = CircuitState.HALF_OPEN
@@ -203,7 +209,7 @@ class CircuitBreaker:
             # Any failure in half-open immediately opens circuit
             _LOGGER.warning("Circuit breaker opening after failure in HALF_OPEN state")
             self._state = CircuitState.OPEN
-            self._opened_at = datetime.now(UTC)
+            self._opened_at = self._time_func()
             self._failure_count += 1
             self._success_count = 0
 
@@ -217,7 +223,7 @@ class CircuitBreaker:
                     self._failure_count,
                 )
                 self._state = CircuitState.OPEN
-                self._opened_at = datetime.now(UTC)
+                self._opened_at = self._time_func()
 
     def reset(self) -> None:
         """Reset circuit breaker to closed state."""
@@ -243,8 +249,7 @@ class ExponentialBackoff:
                 return await make_request()
             except Exception:
                 if attempt < backoff.max_retries - 1:
-                    delay = backoff.calculate_delay(attempt)
-                    await asyncio.sleep(delay)
+                    await backoff.sleep(backoff.calculate_delay(attempt))
                 else:
                     raise
     """
@@ -257,6 +262,7 @@ class ExponentialBackoff:
         exponential_base: float = 2.0,
         *,
         jitter: bool = True,
+        sleep_func: Callable[[float], Awaitable[object]] = asyncio.sleep,
     ) -> None:
         """Initialize exponential backoff calculator.
 
@@ -266,6 +272,8 @@ class ExponentialBackoff:
             max_retries: Maximum number of retry attempts.
             exponential_base: Multiplier for exponential growth.
             jitter: Add randomness to delays (prevents thundering herd).
+            sleep_func: Coroutine function used to wait between retries.
+                Defaults to asyncio.sleep; tests may inject a no-op sleeper.
         """
         self.config = ExponentialBackoffConfig(
             base_delay=base_delay,
@@ -274,6 +282,7 @@ class ExponentialBackoff:
             exponential_base=exponential_base,
             jitter=jitter,
         )
+        self._sleep_func = sleep_func
 
     @property
     def max_retries(self) -> int:
@@ -301,6 +310,14 @@ class ExponentialBackoff:
 
         return delay
 
+    async def sleep(self, delay: float) -> None:
+        """Wait between retry attempts using the configured sleep function.
+
+        Args:
+            delay: Seconds to wait, usually from calculate_delay().
+        """
+        await self._sleep_func(delay)
+
 
 class RateLimiter:
     """Rate limit handler with Retry-After header support.
@@ -489,7 +506,7 @@ async def retry_with_backoff(
                     exc,
                     delay,
                 )
-                await asyncio.sleep(delay)
+                await backoff.sleep(delay)
             else:
                 _LOGGER.exception(
                     "All %d retry attempts exhausted",
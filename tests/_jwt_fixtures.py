@@ -0,0 +1,31 @@
+"""Sample JWT strings shared by the authentication tests."""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any
+
+
+def _decode_payload(token: str) -> dict[str, Any]:
+    """Decode a JWT payload segment independently of the code under test."""
+    segment = token.split(".")[1]
+    decoded: dict[str, Any] = json.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    return decoded
+
+
+VALID_JWT_USER123 = (
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMiLCJleHAiOjE3MzAwMDAwMDB9.signature"
+)
+VALID_JWT_USER123_PAYLOAD = _decode_payload(VALID_JWT_USER123)
+
+PADDED_JWT_TEST = "header.eyJjdXN0b206dXNlcl9pZCI6InRlc3QifQ.signature"
+PADDED_JWT_TEST_PAYLOAD = _decode_payload(PADDED_JWT_TEST)
+
+INVALID_FORMAT_JWT = "invalid.token"
+INVALID_B64_JWT = "header.!!!invalid_base64!!!.signature"
+
+ID_TOKEN_USER123 = "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.sig"
+ID_TOKEN_USER = "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIifQ.sig"
+ID_TOKEN_OLDUSER = "header.eyJjdXN0b206dXNlcl9pZCI6Im9sZHVzZXIifQ.sig"
+ID_TOKEN_NEWUSER = "header.eyJjdXN0b206dXNlcl9pZCI6Im5ld3VzZXIifQ.sig"
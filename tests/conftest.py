@@ -2,36 +2,282 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from http import HTTPStatus
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Self
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
+
+from pythermacell.auth import AuthenticationHandler
+from pythermacell.const import DEFAULT_BASE_URL
+from tests._jwt_fixtures import ID_TOKEN_USER123
 
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncIterator, Mapping
+
+
+HandlerFactory = Callable[..., AuthenticationHandler]
+
+LOGIN_URL = f"{DEFAULT_BASE_URL}/v1/login2"
+
+_EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+
+# Captured at import so fakes can yield even while asyncio.sleep is patched.
+_real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Controllable monotonic clock for time-dependent tests.
+
+    Instances are callable so they can be injected anywhere a
+    ``time.monotonic``-style function is expected.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        """Initialize the clock at the given time in seconds."""
+        self.now = start
+
+    def __call__(self) -> float:
+        """Return the current fake time in seconds."""
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward by the given number of seconds."""
+        self.now += seconds
+
+    async def sleep(self, delay: float) -> None:
+        """Advance the clock by ``delay`` and yield once to the event loop.
+
+        Usable as an ``ExponentialBackoff`` ``sleep_func``.
+        """
+        self.advance(delay)
+        await _real_sleep(0)
+
+
+# Read-only so tests sharing it cannot leak edits; derive variants with
+# {**DEFAULT_AUTH_BODY, "accesstoken": ...}.
+DEFAULT_AUTH_BODY: Mapping[str, Any] = MappingProxyType(
+    {
+        "accesstoken": "token123",
+        "idtoken": ID_TOKEN_USER123,
+    }
+)
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response used as ``async with`` target.
+
+    Much cheaper to build than a ``MagicMock`` with ``AsyncMock`` dunders,
+    and sufficient for code that only reads ``status``, ``headers`` and
+    ``json()``. Pass ``error`` to simulate a request that fails while the
+    response context is entered (timeouts, connection errors).
+    """
+
+    __slots__ = ("_body", "_error", "headers", "status")
+
+    def __init__(
+        self,
+        status: int = HTTPStatus.OK,
+        body: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] = _EMPTY_HEADERS,
+        *,
+        error: BaseException | None = None,
+    ) -> None:
+        """Initialize the response with a status, JSON body, headers and error."""
+        self.status = status
+        self._body = body
+        self.headers = headers
+        self._error = error
+
+    async def json(self) -> Mapping[str, Any] | None:
+        """Return the JSON body."""
+        return self._body
+
+    async def __aenter__(self) -> Self:
+        """Enter the response context, raising the configured error if any."""
+        if self._error is not None:
+            raise self._error
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Exit the response context."""
+
+
+# FakeResponse holds no per-request state, so one instance can be served
+# for any number of successful logins across the whole session.
+AUTH_OK_RESPONSE = FakeResponse(body=DEFAULT_AUTH_BODY)
+
+
+class ScriptedPost:
+    """Stand-in for ``session.post`` that serves scripted responses for one URL.
+
+    Each call checks the requested URL and returns the next response in
+    order, so a test declares the exchange up front instead of branching
+    on a call counter.
+    """
+
+    def __init__(self, url: str, *responses: FakeResponse) -> None:
+        """Initialize with the expected URL and the responses to serve."""
+        self.url = url
+        self._responses = deque(responses)
+
+    def __call__(self, url: str, **kwargs: Any) -> FakeResponse:
+        """Return the next scripted response for a request to ``url``."""
+        assert url == self.url, f"Unexpected POST to {url}, expected {self.url}"
+        return self._responses.popleft()
+
+    @property
+    def exhausted(self) -> bool:
+        """Return whether every scripted response has been served."""
+        return not self._responses
+
+
+class CountingSession:
+    """Session stand-in that serves one response and counts ``post`` calls.
+
+    Provides only ``closed`` and ``post``, which is all the login path
+    touches, and skips the call recording a mocked ``post`` does on every
+    request. Use ``mock_session`` when call arguments need inspecting.
+    """
+
+    __slots__ = ("_response", "closed", "post_calls")
+
+    def __init__(self, response: FakeResponse) -> None:
+        """Initialize with the response served for every ``post``."""
+        self._response = response
+        self.closed = False
+        self.post_calls = 0
+
+    def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        """Count the request and return the configured response."""
+        self.post_calls += 1
+        return self._response
+
+
+def make_auth_response(
+    session: AsyncMock,
+    status: int = HTTPStatus.OK,
+    body: Mapping[str, Any] | None = None,
+) -> FakeResponse:
+    """Build a fake login response and wire it as ``session.post``'s result.
+
+    Args:
+        session: Mock ClientSession whose ``post`` should return the response.
+        status: HTTP status code of the response.
+        body: JSON payload returned by ``response.json()``, if any.
+
+    Returns:
+        The fake response.
+    """
+    response = FakeResponse(status, body)
+    session.post.return_value = response
+    return response
+
+
+def build_handler(session: ClientSession | None = None, **kwargs: Any) -> AuthenticationHandler:
+    """Build an AuthenticationHandler with the default test credentials.
+
+    Args:
+        session: Session to inject, or None to let the handler own one.
+        **kwargs: Extra constructor arguments; ``username`` and ``password``
+            override the defaults.
+
+    Returns:
+        New AuthenticationHandler.
+    """
+    kwargs.setdefault("username", "test@example.com")
+    kwargs.setdefault("password", "password123")
+    return AuthenticationHandler(session=session, **kwargs)
 
 
 @pytest.fixture
-async def mock_session() -> AsyncGenerator[ClientSession]:
-    """Create a mock aiohttp ClientSession.
+def fake_clock() -> FakeClock:
+    """Create a fake monotonic clock starting at zero.
+
+    Returns:
+        FakeClock instance for injection into time-dependent components.
+    """
+    return FakeClock()
+
+
+@pytest.fixture
+def virtual_sleep(fake_clock: FakeClock, monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Make ``asyncio.sleep`` advance ``fake_clock`` instead of waiting.
+
+    The shim still yields to the event loop once so task scheduling order
+    is preserved, but backoff and rate-limit delays cost no wall-clock time.
+
+    Returns:
+        The FakeClock advanced by every patched sleep.
+    """
+
+    async def fake_sleep(delay: float, result: Any = None) -> Any:
+        fake_clock.advance(delay)
+        return await _real_sleep(0, result)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return fake_clock
+
+
+@pytest.fixture(scope="module")
+def readonly_handler() -> AuthenticationHandler:
+    """Create one AuthenticationHandler shared by a module's read-only tests.
+
+    Tests that mutate token state must restore it before returning so the
+    shared instance stays clean.
+
+    Returns:
+        AuthenticationHandler with default test credentials and no session.
+    """
+    return build_handler()
+
+
+@pytest.fixture(scope="session")
+async def shared_session() -> AsyncIterator[ClientSession]:
+    """Provide one real aiohttp ClientSession for the whole test session.
+
+    For tests that talk to local aiohttp test servers, so the session and
+    its connector are created and closed once rather than per test.
 
     Yields:
+        Open ClientSession, closed at the end of the test session.
+    """
+    connector = TCPConnector(limit=100, limit_per_host=20)
+    async with ClientSession(connector=connector) as session:
+        yield session
+
+
+_mock_session_pool: dict[str, AsyncMock] = {}
+
+
+@pytest.fixture
+def mock_session(request: pytest.FixtureRequest) -> AsyncMock:
+    """Provide a mock aiohttp ClientSession, reused across tests in a worker.
+
+    Building a spec'd ``AsyncMock`` is comparatively expensive, so one
+    instance is kept per xdist worker and reset before each test.
+
+    Returns:
         Mock ClientSession for testing.
     """
-    session = AsyncMock(spec=ClientSession)
+    worker_id = getattr(request.config, "workerinput", {}).get("workerid", "main")
+    session = _mock_session_pool.get(worker_id)
+    if session is None:
+        session = _mock_session_pool[worker_id] = AsyncMock(spec=ClientSession)
+    session.reset_mock(return_value=True, side_effect=True)
     session.closed = False
 
     async def mock_close() -> None:
         session.closed = True
 
     session.close = mock_close
-
-    yield session
-
-    if not session.closed:
-        await session.close()
+    return session
 
 
 @pytest.fixture
@@ -45,3 +291,51 @@ def mock_response() -> MagicMock:
     response.status = 200
     response.headers = {}
     return response
+
+
+@pytest.fixture
+def make_handler(mock_session: AsyncMock) -> HandlerFactory:
+    """Provide a factory for handlers bound to ``mock_session``.
+
+    Credentials and session are fixed; keyword arguments such as
+    ``circuit_breaker`` or ``backoff`` are passed through.
+
+    Returns:
+        Callable returning a new AuthenticationHandler per call.
+    """
+
+    def factory(**kwargs: Any) -> AuthenticationHandler:
+        return build_handler(mock_session, **kwargs)
+
+    return factory
+
+
+@pytest.fixture(scope="module")
+def auth_ok_response() -> FakeResponse:
+    """Provide the shared successful login response.
+
+    Returns:
+        AUTH_OK_RESPONSE.
+    """
+    return AUTH_OK_RESPONSE
+
+
+@pytest.fixture
+def counting_session(auth_ok_response: FakeResponse) -> CountingSession:
+    """Create a CountingSession whose logins succeed with DEFAULT_AUTH_BODY.
+
+    Returns:
+        CountingSession serving ``auth_ok_response``.
+    """
+    return CountingSession(auth_ok_response)
+
+
+@pytest.fixture
+def wired_mock_session(mock_session: AsyncMock) -> AsyncMock:
+    """Create a mock ClientSession whose login succeeds with DEFAULT_AUTH_BODY.
+
+    Returns:
+        Mock ClientSession with ``post`` wired to a successful login response.
+    """
+    mock_session.post.return_value = AUTH_OK_RESPONSE
+    return mock_session
@@ -4,22 +4,17 @@ from __future__ import annotations
 
 import asyncio
 import os
-from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
-from dotenv import load_dotenv
+import pytest_asyncio
+from aiohttp import ClientSession, TCPConnector
 
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
-    from pythermacell import ThermacellClient
-
-
-# Load .env file from project root
-env_path = Path(__file__).parents[2] / ".env"
-load_dotenv(env_path)
+    from pythermacell import ThermacellClient, ThermacellDevice
 
 
 @pytest.fixture(scope="session")
@@ -62,6 +57,69 @@ def test_node_id() -> str | None:
     return os.getenv("THERMACELL_TEST_NODE_ID")
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session() -> AsyncGenerator[ClientSession]:
+    """Create one aiohttp session shared by every test in the run.
+
+    Sharing the session keeps pooled keep-alive connections to the API open
+    across tests instead of paying a fresh TCP/TLS handshake per test.
+    Tests using it must run on the session event loop.
+    """
+    connector = TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=60)
+    async with ClientSession(connector=connector) as sess:
+        yield sess
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def authed_client(
+    integration_config: dict[str, str],
+    session: ClientSession,
+) -> AsyncGenerator[ThermacellClient]:
+    """Create an authenticated client on the shared session.
+
+    The client is configured with exponential backoff and a rate limiter so
+    read-only tests can verify those patterns don't interfere with requests.
+    """
+    from pythermacell import ThermacellClient
+    from pythermacell.resilience import ExponentialBackoff, RateLimiter
+
+    client = ThermacellClient(
+        username=integration_config["username"],
+        password=integration_config["password"],
+        base_url=integration_config["base_url"],
+        session=session,
+        backoff=ExponentialBackoff(base_delay=0.5, max_delay=2.0, max_retries=3),
+        rate_limiter=RateLimiter(respect_retry_after=True, default_retry_delay=30.0, max_retry_delay=120.0),
+    )
+
+    async with client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def devices_probe(authed_client: ThermacellClient) -> list[ThermacellDevice]:
+    """Fetch the device list once for read-only tests.
+
+    Tests that only need to observe a successful GET /user/nodes share this
+    result instead of each issuing their own discovery calls.
+    """
+    return await authed_client.get_devices()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def api_snapshot(authed_client: ThermacellClient) -> dict[str, list[Any]]:
+    """Fetch the group list and device list concurrently, once per session.
+
+    Populating the client's device cache up front also lets later group
+    device lookups be served without per-device state fetches.
+
+    Returns:
+        Dictionary with "groups" (list of Group) and "devices" (list of ThermacellDevice).
+    """
+    groups, devices = await asyncio.gather(authed_client.get_groups(), authed_client.get_devices())
+    return {"groups": groups, "devices": devices}
+
+
 # Shared client cache (module-scoped to avoid pytest-asyncio scope issues)
 _client_cache: dict[str, ThermacellClient] = {}
 
@@ -165,6 +223,34 @@ def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line("markers", "slow: Slow tests that may take several seconds")
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Pin integration tests to one xdist worker and skip them without credentials.
+
+    The shared ``xdist_group`` keeps ``--dist loadgroup`` from spreading live
+    API calls across workers; it must be added before xdist reads the
+    markers, hence ``tryfirst``. Checking the environment once here avoids
+    dispatching a credential-probe fixture for every test.
+
+    Tests marked ``slow`` wait on real devices and the rate-limit delay, so
+    they are exempted from the global ``timeout`` cap.
+    """
+    integration_items = [item for item in items if item.get_closest_marker("integration") is not None]
+    for item in integration_items:
+        item.add_marker(pytest.mark.xdist_group(name="integration"))
+        if item.get_closest_marker("slow") is not None and item.get_closest_marker("timeout") is None:
+            item.add_marker(pytest.mark.timeout(0))
+
+    if os.getenv("THERMACELL_USERNAME") and os.getenv("THERMACELL_PASSWORD"):
+        return
+
+    skip_no_credentials = pytest.mark.skip(
+        reason="Missing THERMACELL_USERNAME and THERMACELL_PASSWORD environment variables"
+    )
+    for item in integration_items:
+        item.add_marker(skip_no_credentials)
+
+
 @pytest.fixture(autouse=True)
 async def rate_limit_delay(request: pytest.FixtureRequest) -> None:
     """Add delay between integration tests to prevent API rate limiting.
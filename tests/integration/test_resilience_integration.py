@@ -4,28 +4,29 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import time
 from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
 
 import pytest
-from aiohttp import ClientSession
 
 from pythermacell import AuthenticationError, AuthenticationHandler, ThermacellClient
 from pythermacell.resilience import CircuitBreaker, CircuitState, ExponentialBackoff, RateLimiter
 
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import Awaitable, Callable
 
+    from aiohttp import ClientSession
 
-pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+    from pythermacell import ThermacellDevice
+    from tests.conftest import FakeClock
 
 
-@pytest.fixture
-async def session() -> AsyncGenerator[ClientSession]:
-    """Create aiohttp session for tests."""
-    async with ClientSession() as sess:
-        yield sess
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope="session")]
+
+# Single attempt with zero delay: failure tests only need to observe failure
+# events, so they must never wait on retry backoff.
+NO_WAIT_BACKOFF = ExponentialBackoff(base_delay=0.0, max_delay=0.0, max_retries=1, jitter=False)
 
 
 class TestCircuitBreakerIntegration:
@@ -67,6 +68,7 @@ class TestCircuitBreakerIntegration:
             base_url=integration_config["base_url"],
             session=session,
             circuit_breaker=breaker,
+            backoff=NO_WAIT_BACKOFF,
         )
 
         async with client:
@@ -79,11 +81,35 @@ class TestCircuitBreakerIntegration:
             assert breaker.state == CircuitState.OPEN, "Circuit should be open after failures"
             assert breaker.failure_count >= 3, "Failure count should be at least 3"
 
-    async def test_circuit_breaker_recovery(self, integration_config: dict[str, str], session: ClientSession) -> None:
+    async def test_circuit_breaker_recovery(
+        self, integration_config: dict[str, str], session: ClientSession, fake_clock: FakeClock
+    ) -> None:
         """Test circuit breaker can recover after timeout."""
-        # Use short recovery timeout for testing
+        # Inject a fake clock so the recovery timeout elapses without sleeping
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=2.0, success_threshold=1, time_func=fake_clock)
+
+        async def advance(seconds: float) -> None:
+            fake_clock.advance(seconds)
+
+        await self._assert_breaker_recovers(integration_config, session, breaker, advance)
+
+    @pytest.mark.manual
+    async def test_circuit_breaker_recovery_real_timer(
+        self, integration_config: dict[str, str], session: ClientSession
+    ) -> None:
+        """Test circuit breaker recovery against the real monotonic clock."""
         breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=2.0, success_threshold=1)
 
+        await self._assert_breaker_recovers(integration_config, session, breaker, asyncio.sleep)
+
+    @staticmethod
+    async def _assert_breaker_recovers(
+        integration_config: dict[str, str],
+        session: ClientSession,
+        breaker: CircuitBreaker,
+        wait: Callable[[float], Awaitable[None]],
+    ) -> None:
+        """Open the breaker with bad credentials, wait out recovery, then close it."""
         # First, cause circuit to open with invalid credentials
         bad_client = ThermacellClient(
             username="invalid@example.com",
@@ -91,6 +117,7 @@ class TestCircuitBreakerIntegration:
             base_url=integration_config["base_url"],
             session=session,
             circuit_breaker=breaker,
+            backoff=NO_WAIT_BACKOFF,
         )
 
         async with bad_client:
@@ -101,7 +128,7 @@ class TestCircuitBreakerIntegration:
         assert breaker.state == CircuitState.OPEN, "Circuit should be open"
 
         # Wait for recovery timeout
-        await asyncio.sleep(3)
+        await wait(3.0)
 
         # Circuit should transition to half-open
         assert breaker.state == CircuitState.HALF_OPEN, "Circuit should be half-open after timeout"
@@ -130,7 +157,9 @@ class TestExponentialBackoffIntegration:
         self, integration_config: dict[str, str], session: ClientSession
     ) -> None:
         """Test exponential backoff retries authentication failures."""
-        backoff = ExponentialBackoff(base_delay=0.5, max_delay=2.0, max_retries=3)
+        # Inject a stub sleeper so retries happen instantly
+        mock_sleep = AsyncMock()
+        backoff = ExponentialBackoff(base_delay=0.5, max_delay=2.0, max_retries=3, sleep_func=mock_sleep)
 
         client = ThermacellClient(
             username="invalid@example.com",
@@ -141,81 +170,31 @@ class TestExponentialBackoffIntegration:
         )
 
         async with client:
-            start_time = time.time()
-
-            # This should retry 3 times with backoff
+            # This should try 3 times, backing off between attempts
             with contextlib.suppress(AuthenticationError):
                 await client.get_devices()
 
-            elapsed = time.time() - start_time
+        # One backoff wait between each pair of attempts, jittered within
+        # [0, base_delay * 2^attempt]
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert len(delays) == backoff.max_retries - 1, "Should back off between retries"
+        assert delays[0] <= 0.5
+        assert delays[1] <= 1.0
 
-            # Should have taken at least some time due to retries
-            # With base_delay=0.5 and 3 retries, minimum time is ~1.5s
-            # (0.5 + 1.0 + 1.5 with jitter reducing it)
-            assert elapsed >= 0.5, "Should have taken time for retries"
-
-    async def test_backoff_succeeds_with_valid_credentials(
-        self, integration_config: dict[str, str], session: ClientSession
-    ) -> None:
+    async def test_backoff_succeeds_with_valid_credentials(self, devices_probe: list[ThermacellDevice]) -> None:
         """Test backoff pattern doesn't interfere with successful requests."""
-        backoff = ExponentialBackoff(base_delay=0.5, max_delay=2.0, max_retries=3)
-
-        client = ThermacellClient(
-            username=integration_config["username"],
-            password=integration_config["password"],
-            base_url=integration_config["base_url"],
-            session=session,
-            backoff=backoff,
-        )
-
-        async with client:
-            # Should succeed on first try without retries
-            devices = await client.get_devices()
-            assert isinstance(devices, list), "Request should succeed"
+        # devices_probe is fetched by a client configured with exponential backoff
+        assert isinstance(devices_probe, list), "Request should succeed"
 
 
 class TestRateLimiterIntegration:
     """Integration tests for rate limiter with real API."""
 
-    async def test_rate_limiter_configuration(self, integration_config: dict[str, str], session: ClientSession) -> None:
-        """Test rate limiter is properly configured."""
-        rate_limiter = RateLimiter(respect_retry_after=True, default_retry_delay=30.0, max_retry_delay=120.0)
-
-        client = ThermacellClient(
-            username=integration_config["username"],
-            password=integration_config["password"],
-            base_url=integration_config["base_url"],
-            session=session,
-            rate_limiter=rate_limiter,
-        )
-
-        async with client:
-            # Make normal request
-            devices = await client.get_devices()
-            assert isinstance(devices, list), "Request should succeed"
-
-            # Rate limiter should not interfere with normal requests
-            # (only activates on 429 responses)
-
-    async def test_rate_limiter_delay_calculation(self) -> None:
-        """Test rate limiter calculates delays correctly."""
-        rate_limiter = RateLimiter(respect_retry_after=True, default_retry_delay=60.0, max_retry_delay=300.0)
-
-        # Test with no Retry-After header
-        delay = rate_limiter.get_retry_delay(429, None)
-        assert delay == 60.0, "Should use default delay when no header"
-
-        # Test with Retry-After header (seconds)
-        delay = rate_limiter.get_retry_delay(429, "30")
-        assert delay == 30.0, "Should parse Retry-After as seconds"
-
-        # Test with Retry-After header exceeding max
-        delay = rate_limiter.get_retry_delay(429, "500")
-        assert delay == 300.0, "Should cap at max_retry_delay"
-
-        # Test with non-429 status
-        delay = rate_limiter.get_retry_delay(200, "30")
-        assert delay == 0.0, "Should return 0 for non-429 status"
+    async def test_rate_limiter_configuration(self, devices_probe: list[ThermacellDevice]) -> None:
+        """Test rate limiter doesn't interfere with normal requests."""
+        # devices_probe is fetched by a client configured with a rate limiter,
+        # which only activates on 429 responses
+        assert isinstance(devices_probe, list), "Request should succeed"
 
 
 class TestCombinedResiliencePatterns:
@@ -343,6 +322,7 @@ class TestResilienceEdgeCases:
             base_url=integration_config["base_url"],
             session=session,
             circuit_breaker=breaker,
+            backoff=NO_WAIT_BACKOFF,
         )
 
         async with bad_client:
@@ -357,34 +337,3 @@ class TestResilienceEdgeCases:
 
         assert breaker.state == CircuitState.CLOSED, "Circuit should be closed after reset"
         assert breaker.failure_count == 0, "Failure count should be 0 after reset"
-
-    async def test_backoff_delay_progression(self) -> None:
-        """Test exponential backoff delay progression."""
-        backoff = ExponentialBackoff(base_delay=1.0, exponential_base=2.0, max_delay=60.0, jitter=False)
-
-        # Test delay progression
-        delay0 = backoff.calculate_delay(0)
-        delay1 = backoff.calculate_delay(1)
-        delay2 = backoff.calculate_delay(2)
-        delay3 = backoff.calculate_delay(3)
-
-        # Without jitter, delays should be: 1, 2, 4, 8
-        assert delay0 == 1.0, "First delay should be base_delay"
-        assert delay1 == 2.0, "Second delay should be base_delay * 2"
-        assert delay2 == 4.0, "Third delay should be base_delay * 4"
-        assert delay3 == 8.0, "Fourth delay should be base_delay * 8"
-
-    async def test_backoff_with_jitter_variation(self) -> None:
-        """Test exponential backoff jitter adds randomness."""
-        backoff = ExponentialBackoff(base_delay=10.0, jitter=True)
-
-        # Calculate same delay multiple times
-        delays = [backoff.calculate_delay(1) for _ in range(10)]
-
-        # With jitter, delays should vary
-        unique_delays = set(delays)
-        assert len(unique_delays) > 1, "Jitter should produce different delays"
-
-        # All delays should be less than or equal to max calculated delay
-        max_calculated = 10.0 * 2.0  # base * exponential_base^1
-        assert all(d <= max_calculated for d in delays), "All delays should be within bounds"
@@ -2,22 +2,49 @@
 
 from __future__ import annotations
 
+import asyncio
 import builtins
 from http import HTTPStatus
-from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import TYPE_CHECKING, Any, Literal
 
 import pytest
 from aiohttp import ClientError
 
 from pythermacell.auth import AuthenticationHandler
 from pythermacell.exceptions import AuthenticationError, ThermacellConnectionError, ThermacellTimeoutError
+from tests._jwt_fixtures import (
+    INVALID_B64_JWT,
+    INVALID_FORMAT_JWT,
+    PADDED_JWT_TEST,
+    PADDED_JWT_TEST_PAYLOAD,
+    VALID_JWT_USER123,
+    VALID_JWT_USER123_PAYLOAD,
+)
+from tests.conftest import FakeResponse, build_handler, make_auth_response
 
 
 if TYPE_CHECKING:
     from aiohttp import ClientSession
 
 
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+
+class CountingLock(asyncio.Lock):
+    """asyncio.Lock that counts how many times it was acquired."""
+
+    def __init__(self) -> None:
+        """Initialize the lock with a zero acquire count."""
+        super().__init__()
+        self.acquires = 0
+
+    async def acquire(self) -> Literal[True]:
+        """Count the acquisition and acquire the lock."""
+        self.acquires += 1
+        return await super().acquire()
+
+
+@pytest.mark.xdist_group(name="auth_init")
 class TestAuthenticationHandlerInit:
     """Test AuthenticationHandler initialization."""
 
@@ -62,97 +89,44 @@ class TestAuthenticationHandlerInit:
         assert handler._owns_session is True
 
 
+@pytest.mark.xdist_group(name="auth_jwt_decoding")
 class TestJWTDecoding:
     """Test JWT token decoding."""
 
-    async def test_decode_valid_jwt(self) -> None:
-        """Test decoding a valid JWT token."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-        )
-
-        # Valid JWT with custom:user_id in payload
-        token = (
-            "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
-            "eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMiLCJleHAiOjE3MzAwMDAwMDB9."
-            "signature"
-        )
-
-        payload = handler._decode_jwt_payload(token)
-        assert payload["custom:user_id"] == "user123"
-
-    async def test_decode_jwt_with_padding(self) -> None:
-        """Test decoding JWT that needs base64 padding."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-        )
-
-        # Token that requires padding
-        token = "header.eyJjdXN0b206dXNlcl9pZCI6InRlc3QifQ.signature"
-        payload = handler._decode_jwt_payload(token)
-        assert payload["custom:user_id"] == "test"
-
-    async def test_decode_invalid_jwt_format(self) -> None:
-        """Test decoding JWT with invalid format."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-        )
-
-        # Invalid JWT (not 3 parts)
-        token = "invalid.token"
-        payload = handler._decode_jwt_payload(token)
-        assert payload == {}
-
-    async def test_decode_invalid_jwt_base64(self) -> None:
-        """Test decoding JWT with invalid base64."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-        )
-
-        # Invalid base64 content
-        token = "header.!!!invalid_base64!!!.signature"
-        payload = handler._decode_jwt_payload(token)
-        assert payload == {}
-
-
+    @pytest.mark.parametrize(
+        ("token", "expected"),
+        [
+            (VALID_JWT_USER123, VALID_JWT_USER123_PAYLOAD),
+            (PADDED_JWT_TEST, PADDED_JWT_TEST_PAYLOAD),
+            (INVALID_FORMAT_JWT, {}),
+            (INVALID_B64_JWT, {}),
+        ],
+        ids=["valid", "needs_padding", "invalid_format", "invalid_base64"],
+    )
+    async def test_decode_jwt(
+        self, readonly_handler: AuthenticationHandler, token: str, expected: dict[str, Any]
+    ) -> None:
+        """Test decoding valid, padded, and malformed JWT tokens."""
+        assert readonly_handler._decode_jwt_payload(token) == expected
+
+
+@pytest.mark.xdist_group(name="auth_authentication")
 class TestAuthentication:
     """Test authentication flow."""
 
-    async def test_authenticate_success(self, mock_session: ClientSession) -> None:
+    async def test_authenticate_success(self, wired_mock_session: ClientSession) -> None:
         """Test successful authentication."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
-
-        # Mock successful response
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "access_token_123",
-                "idtoken": ("header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.signature"),
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-
-        mock_session.post.return_value = mock_response
+        handler = build_handler(wired_mock_session)
 
         success = await handler.authenticate()
 
         assert success is True
-        assert handler.access_token == "access_token_123"
+        assert handler.access_token == "token123"
         assert handler.user_id == "user123"
 
         # Verify correct API call
-        mock_session.post.assert_called_once()
-        call_args = mock_session.post.call_args
+        wired_mock_session.post.assert_called_once()
+        call_args = wired_mock_session.post.call_args
         assert call_args[0][0] == "https://api.iot.thermacell.com/v1/login2"
         assert call_args[1]["json"] == {
             "user_name": "test@example.com",
@@ -161,117 +135,63 @@ class TestAuthentication:
 
     async def test_authenticate_invalid_credentials(self, mock_session: ClientSession) -> None:
         """Test authentication with invalid credentials."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="wrong_password",
-            session=mock_session,
-        )
+        handler = build_handler(mock_session, password="wrong_password")
 
         # Mock 401 response
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.UNAUTHORIZED
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
+        make_auth_response(mock_session, status=HTTPStatus.UNAUTHORIZED)
 
         with pytest.raises(AuthenticationError, match="Authentication failed"):
             await handler.authenticate()
 
     async def test_authenticate_missing_access_token(self, mock_session: ClientSession) -> None:
         """Test authentication with missing access token in response."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
+        handler = build_handler(mock_session)
 
         # Mock response without access token
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(return_value={"idtoken": "token"})
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-
-        mock_session.post.return_value = mock_response
+        make_auth_response(mock_session, body={"idtoken": "token"})
 
         with pytest.raises(AuthenticationError, match="Missing access token"):
             await handler.authenticate()
 
+    @pytest.mark.timeout(2)
     async def test_authenticate_timeout(self, mock_session: ClientSession) -> None:
         """Test authentication timeout."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
+        handler = build_handler(mock_session)
 
-        # Mock timeout - need to make the context manager raise the exception
-        async def timeout_side_effect(*args: object, **kwargs: object) -> None:
-            raise builtins.TimeoutError
-
-        mock_response = MagicMock()
-        mock_response.__aenter__ = timeout_side_effect
-        mock_session.post.return_value = mock_response
+        mock_session.post.return_value = FakeResponse(error=builtins.TimeoutError())
 
         with pytest.raises(ThermacellTimeoutError, match="Authentication request timed out"):
             await handler.authenticate()
 
+    @pytest.mark.timeout(2)
     async def test_authenticate_connection_error(self, mock_session: ClientSession) -> None:
         """Test authentication connection error."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
+        handler = build_handler(mock_session)
 
-        # Mock connection error - need to make the context manager raise the exception
-        async def connection_error_side_effect(*args: object, **kwargs: object) -> None:
-            msg = "Connection failed"
-            raise ClientError(msg)
-
-        mock_response = MagicMock()
-        mock_response.__aenter__ = connection_error_side_effect
-        mock_session.post.return_value = mock_response
+        mock_session.post.return_value = FakeResponse(error=ClientError("Connection failed"))
 
         with pytest.raises(ThermacellConnectionError, match="Failed to connect"):
             await handler.authenticate()
 
-    async def test_authenticate_with_lock(self, mock_session: ClientSession) -> None:
+    async def test_authenticate_with_lock(self, wired_mock_session: ClientSession) -> None:
         """Test that authentication uses lock for thread safety."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
+        handler = build_handler(wired_mock_session)
 
-        # Mock successful response
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InRlc3QifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
+        lock = CountingLock()
+        handler._auth_lock = lock
 
-        # Patch the lock to verify it's used
-        with patch.object(handler._auth_lock, "acquire", wraps=handler._auth_lock.acquire) as mock_acquire:
-            await handler.authenticate()
-            mock_acquire.assert_called_once()
+        await handler.authenticate()
+
+        assert lock.acquires == 1
 
 
+@pytest.mark.xdist_group(name="auth_context_manager")
 class TestContextManager:
     """Test context manager functionality."""
 
     async def test_context_manager_creates_session(self) -> None:
         """Test context manager creates session when not provided."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-        )
+        handler = build_handler()
 
         async with handler as h:
             assert h._session is not None
@@ -279,10 +199,7 @@ class TestContextManager:
 
     async def test_context_manager_closes_owned_session(self) -> None:
         """Test context manager closes session it created."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-        )
+        handler = build_handler()
 
         async with handler:
             session = handler._session
@@ -294,11 +211,7 @@ class TestContextManager:
 
     async def test_context_manager_does_not_close_provided_session(self, mock_session: ClientSession) -> None:
         """Test context manager doesn't close provided session."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
+        handler = build_handler(mock_session)
 
         async with handler:
             assert handler._session == mock_session
@@ -307,39 +220,31 @@ class TestContextManager:
         assert not mock_session.closed
 
 
+@pytest.mark.xdist_group(name="auth_is_authenticated")
 class TestIsAuthenticated:
     """Test authentication status checking."""
 
-    async def test_is_authenticated_true(self) -> None:
-        """Test is_authenticated returns True when tokens are set."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-        )
-        handler.access_token = "token"
-        handler.user_id = "user123"
-
-        assert handler.is_authenticated() is True
-
-    async def test_is_authenticated_false_no_token(self) -> None:
-        """Test is_authenticated returns False without access token."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-        )
-        handler.user_id = "user123"
-
-        assert handler.is_authenticated() is False
-
-    async def test_is_authenticated_false_no_user_id(self) -> None:
-        """Test is_authenticated returns False without user ID."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-        )
-        handler.access_token = "token"
-
-        assert handler.is_authenticated() is False
-
-
-# Import asyncio at module level for the test
+    @pytest.mark.parametrize(
+        ("access_token", "user_id", "expected"),
+        [
+            ("token", "user123", True),
+            (None, "user123", False),
+            ("token", None, False),
+        ],
+        ids=["both_set", "no_token", "no_user_id"],
+    )
+    async def test_is_authenticated(
+        self,
+        readonly_handler: AuthenticationHandler,
+        access_token: str | None,
+        user_id: str | None,
+        expected: bool,
+    ) -> None:
+        """Test is_authenticated requires both an access token and a user ID."""
+        readonly_handler.access_token = access_token
+        readonly_handler.user_id = user_id
+        try:
+            assert readonly_handler.is_authenticated() is expected
+        finally:
+            readonly_handler.access_token = None
+            readonly_handler.user_id = None
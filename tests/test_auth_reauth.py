@@ -4,54 +4,54 @@ from __future__ import annotations
 
 from http import HTTPStatus
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from pythermacell.auth import AuthenticationHandler
 from pythermacell.exceptions import AuthenticationError
+from tests._jwt_fixtures import ID_TOKEN_NEWUSER, ID_TOKEN_OLDUSER
+from tests.conftest import FakeResponse, build_handler, make_auth_response
 
 
 if TYPE_CHECKING:
+    from unittest.mock import AsyncMock
+
     from aiohttp import ClientSession
 
+    from pythermacell.auth import AuthenticationHandler
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+
+@pytest.fixture
+def reauth_session(mock_session: AsyncMock) -> AsyncMock:
+    """Wire two sequential login responses for an old and a new user.
+
+    Returns:
+        Mock ClientSession whose ``post`` yields the old then the new tokens.
+    """
+    mock_session.post.side_effect = [
+        FakeResponse(body={"accesstoken": "old_token", "idtoken": ID_TOKEN_OLDUSER}),
+        FakeResponse(body={"accesstoken": "new_token", "idtoken": ID_TOKEN_NEWUSER}),
+    ]
+    return mock_session
+
 
 class TestSessionInjectionBehavior:
     """Test that injected sessions don't auto-authenticate."""
 
     async def test_injected_session_no_auto_authenticate(self, mock_session: ClientSession) -> None:
         """Test that providing a session doesn't trigger automatic authentication."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
+        handler = build_handler(mock_session)
 
         # Verify no authentication occurred during initialization
         mock_session.post.assert_not_called()
         assert handler.access_token is None
         assert handler.user_id is None
 
-    async def test_manual_authenticate_with_injected_session(self, mock_session: ClientSession) -> None:
+    async def test_manual_authenticate_with_injected_session(self, wired_mock_session: ClientSession) -> None:
         """Test that manual authentication works with injected session."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
-
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token123",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
+        handler = build_handler(wired_mock_session)
 
         # Manual authentication should work
         success = await handler.authenticate()
@@ -64,26 +64,9 @@ class TestSessionInjectionBehavior:
 class TestReauthenticationOnExpiry:
     """Test reauthentication when sessions expire."""
 
-    async def test_authenticate_updates_expiry_tracking(self, mock_session: ClientSession) -> None:
+    async def test_authenticate_updates_expiry_tracking(self, wired_mock_session: ClientSession) -> None:
         """Test that successful authentication tracks when it occurred."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
-
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token123",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
+        handler = build_handler(wired_mock_session)
 
         # Before auth
         assert handler.last_authenticated_at is None
@@ -93,53 +76,46 @@ class TestReauthenticationOnExpiry:
         # After auth
         assert handler.last_authenticated_at is not None
 
-    async def test_reauthenticate_clears_old_tokens(self, mock_session: ClientSession) -> None:
-        """Test that reauthentication replaces old tokens."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
-
-        # First authentication
-        mock_response1 = MagicMock()
-        mock_response1.status = HTTPStatus.OK
-        mock_response1.json = AsyncMock(
-            return_value={
-                "accesstoken": "old_token",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6Im9sZHVzZXIifQ.sig",
-            }
-        )
-        mock_response1.__aenter__ = AsyncMock(return_value=mock_response1)
-        mock_response1.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response1
+    @pytest.mark.parametrize(
+        ("force", "expected_token", "expected_user_id", "expected_callbacks"),
+        [
+            (True, "new_token", "newuser", 2),
+            (False, "old_token", "olduser", 1),
+        ],
+        ids=["forced", "cached"],
+    )
+    async def test_second_authenticate_call(
+        self,
+        reauth_session: ClientSession,
+        force: bool,
+        expected_token: str,
+        expected_user_id: str,
+        expected_callbacks: int,
+    ) -> None:
+        """Test that only a forced second call replaces tokens and notifies the callback."""
+        callback_count = 0
+
+        def session_updated(handler: AuthenticationHandler) -> None:
+            nonlocal callback_count
+            callback_count += 1
+
+        handler = build_handler(reauth_session, on_session_updated=session_updated)
 
         await handler.authenticate()
         assert handler.access_token == "old_token"
         assert handler.user_id == "olduser"
+        assert callback_count == 1
 
-        # Second authentication (reauthentication) - must use force=True to reauthenticate
-        mock_response2 = MagicMock()
-        mock_response2.status = HTTPStatus.OK
-        mock_response2.json = AsyncMock(
-            return_value={
-                "accesstoken": "new_token",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6Im5ld3VzZXIifQ.sig",
-            }
-        )
-        mock_response2.__aenter__ = AsyncMock(return_value=mock_response2)
-        mock_response2.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response2
-
-        await handler.authenticate(force=True)
-        assert handler.access_token == "new_token"
-        assert handler.user_id == "newuser"
+        await handler.authenticate(force=force)
+        assert handler.access_token == expected_token
+        assert handler.user_id == expected_user_id
+        assert callback_count == expected_callbacks
 
 
 class TestSessionUpdateCallback:
     """Test session update callback mechanism."""
 
-    async def test_callback_invoked_on_successful_auth(self, mock_session: ClientSession) -> None:
+    async def test_callback_invoked_on_successful_auth(self, wired_mock_session: ClientSession) -> None:
         """Test that callback is invoked when authentication succeeds."""
         callback_invoked = False
         received_handler = None
@@ -149,25 +125,7 @@ class TestSessionUpdateCallback:
             callback_invoked = True
             received_handler = handler
 
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-            on_session_updated=session_updated,
-        )
-
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token123",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
+        handler = build_handler(wired_mock_session, on_session_updated=session_updated)
 
         await handler.authenticate()
 
@@ -183,120 +141,47 @@ class TestSessionUpdateCallback:
             nonlocal callback_invoked
             callback_invoked = True
 
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="wrong_password",
-            session=mock_session,
-            on_session_updated=session_updated,
-        )
+        handler = build_handler(mock_session, password="wrong_password", on_session_updated=session_updated)
 
         # Setup mock 401 response
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.UNAUTHORIZED
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
+        make_auth_response(mock_session, status=HTTPStatus.UNAUTHORIZED)
 
         with pytest.raises(AuthenticationError):
             await handler.authenticate()
 
         assert callback_invoked is False
 
-    async def test_callback_invoked_on_reauthentication(self, mock_session: ClientSession) -> None:
-        """Test that callback is invoked on each reauthentication."""
-        callback_count = 0
-
-        def session_updated(handler: AuthenticationHandler) -> None:
-            nonlocal callback_count
-            callback_count += 1
-
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-            on_session_updated=session_updated,
-        )
-
-        # Setup mock response for both auths
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
-
-        # First authentication
-        await handler.authenticate()
-        assert callback_count == 1
-
-        # Second authentication - must use force=True to reauthenticate
-        await handler.authenticate(force=True)
-        assert callback_count == 2
-
 
 class TestAuthenticationHelpers:
     """Test helper methods for authentication state."""
 
     async def test_needs_reauthentication_no_auth(self) -> None:
         """Test needs_reauthentication returns True when never authenticated."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-        )
+        handler = build_handler()
 
         assert handler.needs_reauthentication() is True
 
-    async def test_needs_reauthentication_after_auth(self, mock_session: ClientSession) -> None:
+    async def test_needs_reauthentication_after_auth(self, wired_mock_session: ClientSession) -> None:
         """Test needs_reauthentication returns False immediately after auth."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
-
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
+        handler = build_handler(wired_mock_session)
 
         await handler.authenticate()
 
         # Should not need reauth immediately
         assert handler.needs_reauthentication() is False
 
-    async def test_clear_authentication_state(self, mock_session: ClientSession) -> None:
+    async def test_needs_reauthentication_after_lifetime(self, wired_mock_session: ClientSession) -> None:
+        """Test needs_reauthentication returns True once the lifetime has elapsed."""
+        handler = build_handler(wired_mock_session, auth_lifetime_seconds=0)
+
+        await handler.authenticate()
+
+        assert handler.is_authenticated() is True
+        assert handler.needs_reauthentication() is True
+
+    async def test_clear_authentication_state(self, wired_mock_session: ClientSession) -> None:
         """Test that clear_authentication removes tokens and tracking."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
-
-        # Authenticate first
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
+        handler = build_handler(wired_mock_session)
 
         await handler.authenticate()
         assert handler.is_authenticated() is True
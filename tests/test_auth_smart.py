@@ -2,299 +2,140 @@
 
 from __future__ import annotations
 
-from http import HTTPStatus
-from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from pythermacell.auth import AuthenticationHandler
+import pytest
+
+from tests._jwt_fixtures import ID_TOKEN_NEWUSER
+from tests.conftest import DEFAULT_AUTH_BODY, CountingSession, FakeResponse, build_handler
 
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping
+
     from aiohttp import ClientSession
 
+    from pythermacell.auth import AuthenticationHandler
+    from tests.conftest import HandlerFactory
+
+
+# One group keeps this small module on a single xdist worker under
+# --dist loadgroup, so the module-scoped auth_ok_response is built once.
+pytestmark = [pytest.mark.unit, pytest.mark.xdist_group(name="auth_smart")]
+
+_NEW_USER_AUTH_BODY = MappingProxyType({"accesstoken": "new_token", "idtoken": ID_TOKEN_NEWUSER})
+
 
-class TestAuthenticateForceParameter:
-    """Test the force parameter in authenticate method."""
-
-    async def test_authenticate_without_force_skips_if_valid(self, mock_session: ClientSession) -> None:
-        """Test that authenticate without force skips if tokens are valid."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-            auth_lifetime_seconds=3600,
-        )
-
-        # First authentication
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token123",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
-
-        await handler.authenticate()
-        assert mock_session.post.call_count == 1
-
-        # Second call without force - should skip
-        result = await handler.authenticate(force=False)
-        assert result is True
-        assert mock_session.post.call_count == 1  # Not called again
-
-    async def test_authenticate_with_force_always_authenticates(self, mock_session: ClientSession) -> None:
-        """Test that authenticate with force=True always authenticates."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
-
-        # First authentication
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token123",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
-
-        await handler.authenticate()
-        assert mock_session.post.call_count == 1
-
-        # Second call with force=True - should call again
-        await handler.authenticate(force=True)
-        assert mock_session.post.call_count == 2
+class YieldingResponse(FakeResponse):
+    """FakeResponse that yields to the event loop before returning its body.
+
+    Lets concurrent callers interleave mid-login, as they would while
+    waiting on the network.
+    """
+
+    __slots__ = ()
+
+    async def json(self) -> Mapping[str, Any] | None:
+        """Yield once, then return the JSON body."""
+        await asyncio.sleep(0)
+        return await super().json()
+
+
+# Handler calls a lifecycle scenario can be built from, keyed by step name.
+_CALLS: dict[str, Callable[[AuthenticationHandler], Awaitable[object]]] = {
+    "authenticate": lambda handler: handler.authenticate(),
+    "authenticate_cached": lambda handler: handler.authenticate(force=False),
+    "authenticate_forced": lambda handler: handler.authenticate(force=True),
+    "ensure": lambda handler: handler.ensure_authenticated(),
+    "force_reauth": lambda handler: handler.force_reauthenticate(),
+}
 
 
 class TestEnsureAuthenticated:
     """Test the ensure_authenticated method."""
 
-    async def test_ensure_authenticated_on_first_call(self, mock_session: ClientSession) -> None:
+    async def test_ensure_authenticated_on_first_call(self, counting_session: CountingSession) -> None:
         """Test that ensure_authenticated authenticates on first call."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
-
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token123",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
+        handler = build_handler(counting_session)
 
         # Should authenticate
         await handler.ensure_authenticated()
 
         assert handler.is_authenticated() is True
-        assert mock_session.post.call_count == 1
-
-    async def test_ensure_authenticated_skips_if_valid(self, mock_session: ClientSession) -> None:
-        """Test that ensure_authenticated skips if tokens are valid."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-            auth_lifetime_seconds=3600,
-        )
-
-        # First authentication
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token123",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
+        assert counting_session.post_calls == 1
 
-        await handler.ensure_authenticated()
-        assert mock_session.post.call_count == 1
+    async def test_concurrent_callers_share_one_login(self) -> None:
+        """Test that concurrent ensure_authenticated calls trigger a single login."""
+        session = CountingSession(YieldingResponse(body=DEFAULT_AUTH_BODY))
+        handler = build_handler(session)
 
-        # Second call - should not authenticate again
-        await handler.ensure_authenticated()
-        assert mock_session.post.call_count == 1  # Still 1
-
-    async def test_ensure_authenticated_multiple_calls_efficient(self, mock_session: ClientSession) -> None:
-        """Test that multiple ensure_authenticated calls are efficient."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
-
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token123",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
-
-        # Call ensure_authenticated 10 times
-        for _ in range(10):
-            await handler.ensure_authenticated()
-
-        # Should only authenticate once
-        assert mock_session.post.call_count == 1
+        await asyncio.gather(*(handler.ensure_authenticated() for _ in range(20)))
+
+        assert session.post_calls == 1
         assert handler.is_authenticated() is True
 
 
 class TestForceReauthenticate:
     """Test the force_reauthenticate method."""
 
-    async def test_force_reauthenticate_always_authenticates(self, mock_session: ClientSession) -> None:
-        """Test that force_reauthenticate always makes API call."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
-
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token123",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
-
-        # Initial authentication
-        await handler.authenticate()
-        assert mock_session.post.call_count == 1
-
-        # Force reauthenticate should call again
-        result = await handler.force_reauthenticate()
-
-        assert result is True
-        assert mock_session.post.call_count == 2
-
-    async def test_force_reauthenticate_after_401_scenario(self, mock_session: ClientSession) -> None:
+    @pytest.mark.parametrize(
+        ("body", "expected"),
+        [
+            (_NEW_USER_AUTH_BODY, ("new_token", "newuser")),
+            ({**DEFAULT_AUTH_BODY, "accesstoken": "rotated_token"}, ("rotated_token", "user123")),
+        ],
+        ids=["new_user", "same_user_rotated_token"],
+    )
+    async def test_force_reauthenticate_after_401_scenario(
+        self,
+        mock_session: ClientSession,
+        make_handler: HandlerFactory,
+        body: Mapping[str, Any],
+        expected: tuple[str, str],
+    ) -> None:
         """Test force_reauthenticate usage after receiving 401 from API."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
-
-        # Setup response
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "new_token",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6Im5ld3VzZXIifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
+        handler = make_handler()
+        mock_session.post.return_value = FakeResponse(body=body)
 
         # Simulate scenario: had old tokens, got 401, force reauth
         handler.access_token = "old_expired_token"
         handler.user_id = "olduser"
 
-        # Force reauthenticate
         await handler.force_reauthenticate()
 
-        # Should have new tokens
-        assert handler.access_token == "new_token"
-        assert handler.user_id == "newuser"
+        assert (handler.access_token, handler.user_id) == expected
 
 
 class TestSmartReauthenticationLifecycle:
     """Test complete lifecycle with smart reauthentication."""
 
-    async def test_typical_usage_pattern(self, mock_session: ClientSession) -> None:
-        """Test typical usage pattern with ensure_authenticated."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-            auth_lifetime_seconds=14400,  # 4 hours
-        )
-
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token123",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
-
-        # Simulate making multiple API calls
-        for _ in range(5):
-            await handler.ensure_authenticated()
-            # ... make API call with handler.access_token
-
-        # Should only authenticate once
-        assert mock_session.post.call_count == 1
-
-    async def test_usage_pattern_with_forced_reauth(self, mock_session: ClientSession) -> None:
-        """Test usage pattern with forced reauth after 401."""
-        handler = AuthenticationHandler(
-            username="test@example.com",
-            password="password123",
-            session=mock_session,
-        )
-
-        mock_response = MagicMock()
-        mock_response.status = HTTPStatus.OK
-        mock_response.json = AsyncMock(
-            return_value={
-                "accesstoken": "token123",
-                "idtoken": "header.eyJjdXN0b206dXNlcl9pZCI6InVzZXIxMjMifQ.sig",
-            }
-        )
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.post.return_value = mock_response
-
-        # Initial authentication
-        await handler.ensure_authenticated()
-        assert mock_session.post.call_count == 1
-
-        # Make a few API calls
-        await handler.ensure_authenticated()
-        await handler.ensure_authenticated()
-        assert mock_session.post.call_count == 1  # Still 1
+    @pytest.mark.parametrize(
+        "steps",
+        [
+            [("authenticate", 1), ("authenticate_cached", 1)],
+            [("authenticate", 1), ("authenticate_forced", 2)],
+            [("ensure", 1), ("ensure", 1)],
+            [("ensure", 1)] * 10,
+            [("authenticate", 1), ("force_reauth", 2)],
+            [("ensure", 1)] * 3 + [("force_reauth", 2)] + [("ensure", 2)] * 2,
+        ],
+        ids=[
+            "authenticate_skips_if_valid",
+            "authenticate_force_always_posts",
+            "ensure_skips_if_valid",
+            "ensure_repeated_posts_once",
+            "force_reauthenticate_always_posts",
+            "ensure_with_forced_reauth",
+        ],
+    )
+    async def test_call_sequence(self, counting_session: CountingSession, steps: list[tuple[str, int]]) -> None:
+        """Test that only the first login and forced reauths reach the API."""
+        handler = build_handler(counting_session)
+
+        for name, expected_post_count in steps:
+            await _CALLS[name](handler)
+            assert counting_session.post_calls == expected_post_count, name
 
-        # Simulate receiving 401 from API
-        # Application calls force_reauthenticate
-        await handler.force_reauthenticate()
-        assert mock_session.post.call_count == 2
-
-        # Continue with API calls
-        await handler.ensure_authenticated()
-        await handler.ensure_authenticated()
-        assert mock_session.post.call_count == 2  # Still 2
+        assert handler.is_authenticated() is True
@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
+import json
+from datetime import timedelta
 from http import HTTPStatus
-from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock
+from typing import TYPE_CHECKING, Any, Self
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
-from aiohttp import web
+from aiohttp import ClientSession, web
 
+from pythermacell.auth import AuthenticationHandler
 from pythermacell.client import ThermacellClient
 from pythermacell.exceptions import DeviceError
 
 
 if TYPE_CHECKING:
-    from aiohttp.test_utils import TestClient
+    from collections.abc import Awaitable, Callable
+
     from aiohttp.web import Application
+    from pytest_aiohttp import AiohttpClient
+
+    ClientFactory = Callable[..., Awaitable[ThermacellClient]]
 
 
 # Sample API responses
@@ -48,39 +55,65 @@ SAMPLE_CONFIG_RESPONSE = {
     "devices": [{"name": "LIV Hub", "serial_num": "SN123456"}],
 }
 
+# Config bodies per node, built once rather than copied on every request
+SAMPLE_CONFIG_BY_NODE = {
+    "node1": SAMPLE_CONFIG_RESPONSE,
+    "node2": {
+        **SAMPLE_CONFIG_RESPONSE,
+        "node_id": "node2",
+        "info": {
+            "name": "Device 2",
+            "type": "thermacell-hub",
+            "fw_version": "5.3.2",
+        },
+    },
+}
 
-@pytest.fixture
+
+# Bodies serialized once at import; handlers serve the bytes directly
+SAMPLE_NODES_BODY = json.dumps(SAMPLE_NODES_RESPONSE).encode()
+SAMPLE_PARAMS_BODY = json.dumps(SAMPLE_PARAMS_RESPONSE).encode()
+SAMPLE_STATUS_BODY = json.dumps(SAMPLE_STATUS_RESPONSE).encode()
+SAMPLE_CONFIG_BODY_BY_NODE = {node_id: json.dumps(config).encode() for node_id, config in SAMPLE_CONFIG_BY_NODE.items()}
+
+
+def _json_body(body: bytes) -> web.Response:
+    """Wrap a pre-serialized JSON body in a response."""
+    return web.Response(body=body, content_type="application/json")
+
+
+def _config_response(request: web.Request) -> web.Response:
+    """Return the config response for the request's ``nodeid`` query parameter."""
+    node_id = request.query.get("nodeid") or "node1"
+    body = SAMPLE_CONFIG_BODY_BY_NODE.get(node_id)
+    if body is None:
+        return web.json_response({**SAMPLE_CONFIG_RESPONSE, "node_id": node_id})
+    return _json_body(body)
+
+
+@pytest.fixture(scope="module")
 def app() -> Application:
     """Create a test aiohttp application."""
     app = web.Application()
 
     async def get_nodes(request: web.Request) -> web.Response:
         """Mock /v1/user/nodes endpoint."""
-        return web.json_response(SAMPLE_NODES_RESPONSE)
+        return _json_body(SAMPLE_NODES_BODY)
 
     async def get_params(request: web.Request) -> web.Response:
         """Mock /v1/user/nodes/params endpoint."""
         node_id = request.query.get("nodeid")
         if node_id == "nonexistent":
             return web.Response(status=HTTPStatus.NOT_FOUND)
-        return web.json_response(SAMPLE_PARAMS_RESPONSE)
+        return _json_body(SAMPLE_PARAMS_BODY)
 
     async def get_status(request: web.Request) -> web.Response:
         """Mock /v1/user/nodes/status endpoint."""
-        return web.json_response(SAMPLE_STATUS_RESPONSE)
+        return _json_body(SAMPLE_STATUS_BODY)
 
     async def get_config(request: web.Request) -> web.Response:
         """Mock /v1/user/nodes/config endpoint."""
-        node_id = request.query.get("nodeid")
-        config = SAMPLE_CONFIG_RESPONSE.copy()
-        config["node_id"] = node_id or "node1"
-        if node_id == "node2":
-            config["info"] = {
-                "name": "Device 2",
-                "type": "thermacell-hub",
-                "fw_version": "5.3.2",
-            }
-        return web.json_response(config)
+        return _config_response(request)
 
     async def update_params(request: web.Request) -> web.Response:
         """Mock PUT /v1/user/nodes/params endpoint."""
@@ -101,46 +134,145 @@ def app() -> Application:
     return app
 
 
+@pytest.fixture(scope="module")
+def shared_counting_app() -> tuple[Application, dict[str, int]]:
+    """Create an app serving device state that counts calls per endpoint.
+
+    Returns:
+        The application and a dict of ``params``/``status``/``config`` call counts.
+    """
+    call_counts = {"params": 0, "status": 0, "config": 0}
+    app = web.Application()
+
+    async def count_params(request: web.Request) -> web.Response:
+        call_counts["params"] += 1
+        return _json_body(SAMPLE_PARAMS_BODY)
+
+    async def count_status(request: web.Request) -> web.Response:
+        call_counts["status"] += 1
+        return _json_body(SAMPLE_STATUS_BODY)
+
+    async def count_config(request: web.Request) -> web.Response:
+        call_counts["config"] += 1
+        return _config_response(request)
+
+    app.router.add_get("/v1/user/nodes/params", count_params)
+    app.router.add_get("/v1/user/nodes/status", count_status)
+    app.router.add_get("/v1/user/nodes/config", count_config)
+
+    return app, call_counts
+
+
 @pytest.fixture
-async def mock_auth() -> AsyncMock:
-    """Create mock authentication handler."""
-    auth = AsyncMock()
+def counting_app(shared_counting_app: tuple[Application, dict[str, int]]) -> tuple[Application, dict[str, int]]:
+    """Reset the shared counting app's call counts before a test.
+
+    Returns:
+        The shared application and its zeroed call counts.
+    """
+    _, call_counts = shared_counting_app
+    call_counts.update(params=0, status=0, config=0)
+    return shared_counting_app
+
+
+class FakeAuth:
+    """Plain stand-in for AuthenticationHandler on the client request path.
+
+    Far cheaper per call than a mock; use ``mock_auth`` when a test needs to
+    assert on auth calls.
+    """
+
+    access_token = "test-access-token"
+    user_id = "test-user-123"
+
+    def set_session(self, session: ClientSession) -> None:
+        """Ignore the session handed over by the API layer."""
+
+    async def ensure_authenticated(self) -> None:
+        """Treat the handler as always authenticated."""
+
+    def is_authenticated(self) -> bool:
+        """Report the handler as authenticated."""
+        return True
+
+    def should_retry_on_status(self, status_code: int) -> bool:
+        """Never request a reauthentication retry."""
+        return False
+
+    async def handle_auth_retry(self, status_code: int) -> None:
+        """Accept a retry request without doing anything."""
+
+    async def __aenter__(self) -> Self:
+        """Enter the auth context."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Exit the auth context."""
+
+
+@pytest.fixture(scope="module")
+def shared_mock_auth() -> MagicMock:
+    """Create the mock authentication handler shared by this module's tests.
+
+    Autospec mirrors AuthenticationHandler, so async methods are awaitable
+    mocks and calls to methods the handler lacks fail loudly.
+    """
+    return create_autospec(AuthenticationHandler, instance=True)
+
+
+@pytest.fixture
+def mock_auth(shared_mock_auth: MagicMock) -> MagicMock:
+    """Reset the shared mock authentication handler to its defaults."""
+    auth = shared_mock_auth
+    auth.reset_mock(return_value=True, side_effect=True)
     auth.access_token = "test-access-token"
     auth.user_id = "test-user-123"
     auth.is_authenticated.return_value = True
-    auth.ensure_authenticated = AsyncMock()
-    auth.should_retry_on_status = MagicMock(return_value=False)
-    auth.set_session = MagicMock()  # Add set_session method
-    auth.__aenter__ = AsyncMock(return_value=auth)
-    auth.__aexit__ = AsyncMock()
+    auth.should_retry_on_status.return_value = False
     return auth
 
 
-class TestClientGetDevices:
-    """Test client.get_devices() method."""
-
-    async def test_get_devices_success(
-        self,
-        aiohttp_client: TestClient,
-        app: Application,
-        mock_auth: AsyncMock,
-    ) -> None:
-        """Test successfully getting device list."""
-        client = await aiohttp_client(app)
-
-        # Create Thermacell client with test server
+@pytest.fixture
+def make_client(aiohttp_client: AiohttpClient, shared_session: ClientSession) -> ClientFactory:
+    """Provide a factory wiring a ThermacellClient to a test server for an app.
+
+    Returns:
+        Async callable returning a ThermacellClient that uses the shared
+        session, pointed at the app's test server. Auth defaults to a new
+        FakeAuth; pass ``auth=mock_auth`` to assert on auth calls.
+    """
+
+    async def factory(app: Application, auth: AuthenticationHandler | None = None) -> ThermacellClient:
+        if auth is None:
+            auth = FakeAuth()
+        test_client = await aiohttp_client(app)
         thermacell_client = ThermacellClient(
             username="test@example.com",
             password="password",
-            base_url=str(client.make_url("")),
+            base_url=str(test_client.make_url("")),
         )
-        thermacell_client._session = client.session
-        thermacell_client._api._session = client.session
-        thermacell_client._api._auth_handler = mock_auth
+        thermacell_client._session = shared_session
+        thermacell_client._api._session = shared_session
+        thermacell_client._api._auth_handler = auth
         thermacell_client._owns_session = False
-        thermacell_client._auth_handler = mock_auth
+        thermacell_client._auth_handler = auth
+        return thermacell_client
+
+    return factory
 
-        devices = await thermacell_client.get_devices()
+
+@pytest.fixture
+async def wired_client(make_client: ClientFactory, app: Application) -> ThermacellClient:
+    """Create a ThermacellClient wired to a test server for the default app."""
+    return await make_client(app)
+
+
+class TestClientGetDevices:
+    """Test client.get_devices() method."""
+
+    async def test_get_devices_success(self, wired_client: ThermacellClient) -> None:
+        """Test successfully getting device list."""
+        devices = await wired_client.get_devices()
 
         assert len(devices) == 2
         assert devices[0].node_id == "node1"
@@ -150,11 +282,7 @@ class TestClientGetDevices:
         assert devices[1].node_id == "node2"
         assert devices[1].name == "Device 2"
 
-    async def test_get_devices_empty_list(
-        self,
-        aiohttp_client: TestClient,
-        mock_auth: AsyncMock,
-    ) -> None:
+    async def test_get_devices_empty_list(self, make_client: ClientFactory) -> None:
         """Test getting devices when none exist."""
         app = web.Application()
 
@@ -162,28 +290,13 @@ class TestClientGetDevices:
             return web.json_response({"nodes": []})
 
         app.router.add_get("/v1/user/nodes", get_empty_nodes)
-        client = await aiohttp_client(app)
-
-        thermacell_client = ThermacellClient(
-            username="test@example.com",
-            password="password",
-            base_url=str(client.make_url("")),
-        )
-        thermacell_client._session = client.session
-        thermacell_client._api._session = client.session
-        thermacell_client._api._auth_handler = mock_auth
-        thermacell_client._owns_session = False
-        thermacell_client._auth_handler = mock_auth
+        thermacell_client = await make_client(app)
 
         devices = await thermacell_client.get_devices()
 
         assert len(devices) == 0
 
-    async def test_get_devices_api_error(
-        self,
-        aiohttp_client: TestClient,
-        mock_auth: AsyncMock,
-    ) -> None:
+    async def test_get_devices_api_error(self, make_client: ClientFactory) -> None:
         """Test get_devices handles API errors."""
         app = web.Application()
 
@@ -191,18 +304,7 @@ class TestClientGetDevices:
             return web.Response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
 
         app.router.add_get("/v1/user/nodes", get_error)
-        client = await aiohttp_client(app)
-
-        thermacell_client = ThermacellClient(
-            username="test@example.com",
-            password="password",
-            base_url=str(client.make_url("")),
-        )
-        thermacell_client._session = client.session
-        thermacell_client._api._session = client.session
-        thermacell_client._api._auth_handler = mock_auth
-        thermacell_client._owns_session = False
-        thermacell_client._auth_handler = mock_auth
+        thermacell_client = await make_client(app)
 
         with pytest.raises(DeviceError, match="Failed to get devices"):
             await thermacell_client.get_devices()
@@ -211,27 +313,9 @@ class TestClientGetDevices:
 class TestClientGetDevice:
     """Test client.get_device() method."""
 
-    async def test_get_device_success(
-        self,
-        aiohttp_client: TestClient,
-        app: Application,
-        mock_auth: AsyncMock,
-    ) -> None:
+    async def test_get_device_success(self, wired_client: ThermacellClient) -> None:
         """Test successfully getting a single device."""
-        client = await aiohttp_client(app)
-
-        thermacell_client = ThermacellClient(
-            username="test@example.com",
-            password="password",
-            base_url=str(client.make_url("")),
-        )
-        thermacell_client._session = client.session
-        thermacell_client._api._session = client.session
-        thermacell_client._api._auth_handler = mock_auth
-        thermacell_client._owns_session = False
-        thermacell_client._auth_handler = mock_auth
-
-        device = await thermacell_client.get_device("node1")
+        device = await wired_client.get_device("node1")
 
         assert device is not None
         assert device.node_id == "node1"
@@ -239,251 +323,49 @@ class TestClientGetDevice:
         assert device.power is True
         assert device.led_brightness == 80
 
-    async def test_get_device_not_found(
-        self,
-        aiohttp_client: TestClient,
-        app: Application,
-        mock_auth: AsyncMock,
-    ) -> None:
+    async def test_get_device_not_found(self, wired_client: ThermacellClient) -> None:
         """Test getting device that doesn't exist."""
-        client = await aiohttp_client(app)
-
-        thermacell_client = ThermacellClient(
-            username="test@example.com",
-            password="password",
-            base_url=str(client.make_url("")),
-        )
-        thermacell_client._session = client.session
-        thermacell_client._api._session = client.session
-        thermacell_client._api._auth_handler = mock_auth
-        thermacell_client._owns_session = False
-        thermacell_client._auth_handler = mock_auth
-
-        device = await thermacell_client.get_device("nonexistent")
+        device = await wired_client.get_device("nonexistent")
 
         assert device is None
 
-    async def test_get_device_cached_no_refresh(
-        self,
-        aiohttp_client: TestClient,
-        app: Application,
-        mock_auth: AsyncMock,
-    ) -> None:
-        """Test getting cached device without refresh (0 API calls)."""
-        call_counts = {"params": 0, "status": 0, "config": 0}
-
-        # Create custom app to count API calls
-        app_with_counter = web.Application()
-
-        async def count_params(request: web.Request) -> web.Response:
-            call_counts["params"] += 1
-            return web.json_response(SAMPLE_PARAMS_RESPONSE)
-
-        async def count_status(request: web.Request) -> web.Response:
-            call_counts["status"] += 1
-            return web.json_response(SAMPLE_STATUS_RESPONSE)
-
-        async def count_config(request: web.Request) -> web.Response:
-            call_counts["config"] += 1
-            node_id = request.query.get("nodeid")
-            config = SAMPLE_CONFIG_RESPONSE.copy()
-            config["node_id"] = node_id or "node1"
-            return web.json_response(config)
-
-        app_with_counter.router.add_get("/v1/user/nodes/params", count_params)
-        app_with_counter.router.add_get("/v1/user/nodes/status", count_status)
-        app_with_counter.router.add_get("/v1/user/nodes/config", count_config)
-
-        test_client = await aiohttp_client(app_with_counter)
-        thermacell_client = ThermacellClient(
-            username="test@example.com",
-            password="password",
-            base_url=str(test_client.make_url("")),
-        )
-        thermacell_client._session = test_client.session
-        thermacell_client._api._session = test_client.session
-        thermacell_client._api._auth_handler = mock_auth
-        thermacell_client._owns_session = False
-        thermacell_client._auth_handler = mock_auth
-
-        # First call: fetch device (3 API calls)
-        device1 = await thermacell_client.get_device("node1")
-        assert device1 is not None
-        assert call_counts["params"] == 1
-        assert call_counts["status"] == 1
-        assert call_counts["config"] == 1
-
-        # Second call: return cached device without refresh (0 API calls)
-        device2 = await thermacell_client.get_device("node1", force_refresh=False)
-        assert device2 is device1  # Same instance
-        assert call_counts["params"] == 1  # No additional calls
-        assert call_counts["status"] == 1
-        assert call_counts["config"] == 1
-
-    async def test_get_device_force_refresh(
-        self,
-        aiohttp_client: TestClient,
-        app: Application,
-        mock_auth: AsyncMock,
+    async def test_get_device_cache_phases(
+        self, make_client: ClientFactory, counting_app: tuple[Application, dict[str, int]]
     ) -> None:
-        """Test force_refresh parameter refreshes cached device."""
-        call_counts = {"params": 0, "status": 0, "config": 0}
-
-        # Create custom app to count API calls
-        app_with_counter = web.Application()
-
-        async def count_params(request: web.Request) -> web.Response:
-            call_counts["params"] += 1
-            return web.json_response(SAMPLE_PARAMS_RESPONSE)
-
-        async def count_status(request: web.Request) -> web.Response:
-            call_counts["status"] += 1
-            return web.json_response(SAMPLE_STATUS_RESPONSE)
-
-        async def count_config(request: web.Request) -> web.Response:
-            call_counts["config"] += 1
-            node_id = request.query.get("nodeid")
-            config = SAMPLE_CONFIG_RESPONSE.copy()
-            config["node_id"] = node_id or "node1"
-            return web.json_response(config)
-
-        app_with_counter.router.add_get("/v1/user/nodes/params", count_params)
-        app_with_counter.router.add_get("/v1/user/nodes/status", count_status)
-        app_with_counter.router.add_get("/v1/user/nodes/config", count_config)
-
-        test_client = await aiohttp_client(app_with_counter)
-        thermacell_client = ThermacellClient(
-            username="test@example.com",
-            password="password",
-            base_url=str(test_client.make_url("")),
-        )
-        thermacell_client._session = test_client.session
-        thermacell_client._api._session = test_client.session
-        thermacell_client._api._auth_handler = mock_auth
-        thermacell_client._owns_session = False
-        thermacell_client._auth_handler = mock_auth
+        """Test which get_device options reuse the cached device and which refetch it."""
+        app, call_counts = counting_app
+        thermacell_client = await make_client(app)
 
         # First call: fetch device (3 API calls)
         device1 = await thermacell_client.get_device("node1")
         assert device1 is not None
-        assert call_counts["params"] == 1
-        assert call_counts["status"] == 1
-        assert call_counts["config"] == 1
-
-        # Second call with force_refresh: refresh device (3 more API calls)
-        device2 = await thermacell_client.get_device("node1", force_refresh=True)
-        assert device2 is device1  # Same instance
-        assert call_counts["params"] == 2  # Refreshed
-        assert call_counts["status"] == 2  # Refreshed
-        assert call_counts["config"] == 2  # Refreshed
-
-    async def test_get_device_max_age_not_stale(
-        self,
-        aiohttp_client: TestClient,
-        app: Application,
-        mock_auth: AsyncMock,
-    ) -> None:
-        """Test max_age_seconds doesn't refresh if state is fresh."""
-        call_counts = {"params": 0, "status": 0, "config": 0}
-
-        # Create custom app to count API calls
-        app_with_counter = web.Application()
-
-        async def count_params(request: web.Request) -> web.Response:
-            call_counts["params"] += 1
-            return web.json_response(SAMPLE_PARAMS_RESPONSE)
-
-        async def count_status(request: web.Request) -> web.Response:
-            call_counts["status"] += 1
-            return web.json_response(SAMPLE_STATUS_RESPONSE)
-
-        async def count_config(request: web.Request) -> web.Response:
-            call_counts["config"] += 1
-            node_id = request.query.get("nodeid")
-            config = SAMPLE_CONFIG_RESPONSE.copy()
-            config["node_id"] = node_id or "node1"
-            return web.json_response(config)
-
-        app_with_counter.router.add_get("/v1/user/nodes/params", count_params)
-        app_with_counter.router.add_get("/v1/user/nodes/status", count_status)
-        app_with_counter.router.add_get("/v1/user/nodes/config", count_config)
-
-        test_client = await aiohttp_client(app_with_counter)
-        thermacell_client = ThermacellClient(
-            username="test@example.com",
-            password="password",
-            base_url=str(test_client.make_url("")),
-        )
-        thermacell_client._session = test_client.session
-        thermacell_client._api._session = test_client.session
-        thermacell_client._api._auth_handler = mock_auth
-        thermacell_client._owns_session = False
-        thermacell_client._auth_handler = mock_auth
-
-        # First call: fetch device (3 API calls)
-        device1 = await thermacell_client.get_device("node1")
-        assert device1 is not None
-        assert call_counts["params"] == 1
-
-        # Second call with max_age_seconds=60: state is fresh, no refresh (0 API calls)
-        device2 = await thermacell_client.get_device("node1", max_age_seconds=60)
-        assert device2 is device1
-        assert call_counts["params"] == 1  # No refresh
-        assert call_counts["status"] == 1
-        assert call_counts["config"] == 1
+        assert call_counts == {"params": 1, "status": 1, "config": 1}
+
+        # (phase, get_device kwargs, expected call count per endpoint afterwards)
+        phases = [
+            ("cached_no_refresh", {"force_refresh": False}, 1),
+            ("max_age_not_stale", {"max_age_seconds": 60}, 1),
+            ("force_refresh", {"force_refresh": True}, 2),
+        ]
+        for phase, kwargs, expected in phases:
+            device = await thermacell_client.get_device("node1", **kwargs)
+            assert device is device1, phase  # Same instance
+            assert call_counts == {"params": expected, "status": expected, "config": expected}, phase
 
     async def test_get_device_max_age_stale(
-        self,
-        aiohttp_client: TestClient,
-        app: Application,
-        mock_auth: AsyncMock,
+        self, make_client: ClientFactory, counting_app: tuple[Application, dict[str, int]]
     ) -> None:
         """Test max_age_seconds refreshes if state is stale."""
-        import asyncio
-
-        call_counts = {"params": 0, "status": 0, "config": 0}
-
-        # Create custom app to count API calls
-        app_with_counter = web.Application()
-
-        async def count_params(request: web.Request) -> web.Response:
-            call_counts["params"] += 1
-            return web.json_response(SAMPLE_PARAMS_RESPONSE)
-
-        async def count_status(request: web.Request) -> web.Response:
-            call_counts["status"] += 1
-            return web.json_response(SAMPLE_STATUS_RESPONSE)
-
-        async def count_config(request: web.Request) -> web.Response:
-            call_counts["config"] += 1
-            node_id = request.query.get("nodeid")
-            config = SAMPLE_CONFIG_RESPONSE.copy()
-            config["node_id"] = node_id or "node1"
-            return web.json_response(config)
-
-        app_with_counter.router.add_get("/v1/user/nodes/params", count_params)
-        app_with_counter.router.add_get("/v1/user/nodes/status", count_status)
-        app_with_counter.router.add_get("/v1/user/nodes/config", count_config)
-
-        test_client = await aiohttp_client(app_with_counter)
-        thermacell_client = ThermacellClient(
-            username="test@example.com",
-            password="password",
-            base_url=str(test_client.make_url("")),
-        )
-        thermacell_client._session = test_client.session
-        thermacell_client._api._session = test_client.session
-        thermacell_client._api._auth_handler = mock_auth
-        thermacell_client._owns_session = False
-        thermacell_client._auth_handler = mock_auth
+        app, call_counts = counting_app
+        thermacell_client = await make_client(app)
 
         # First call: fetch device (3 API calls)
         device1 = await thermacell_client.get_device("node1")
         assert device1 is not None
         assert call_counts["params"] == 1
 
-        # Wait for state to become stale
-        await asyncio.sleep(0.2)
+        # Age the cached state past max_age_seconds without waiting
+        device1._last_refresh -= timedelta(seconds=1)
 
         # Second call with max_age_seconds=0.1: state is stale, refresh (3 API calls)
         device2 = await thermacell_client.get_device("node1", max_age_seconds=0.1)
@@ -498,8 +380,8 @@ class TestClientAuthenticationIntegration:
 
     async def test_reauthentication_on_401(
         self,
-        aiohttp_client: TestClient,
-        mock_auth: AsyncMock,
+        make_client: ClientFactory,
+        mock_auth: MagicMock,
     ) -> None:
         """Test automatic reauthentication on 401."""
         app = web.Application()
@@ -514,22 +396,11 @@ class TestClientAuthenticationIntegration:
             return web.json_response({"nodes": []})
 
         app.router.add_get("/v1/user/nodes", get_nodes_with_auth_retry)
-        client = await aiohttp_client(app)
 
         # Configure mock auth to trigger retry
-        mock_auth.should_retry_on_status = MagicMock(side_effect=lambda status: status == HTTPStatus.UNAUTHORIZED)
-        mock_auth.handle_auth_retry = AsyncMock()
+        mock_auth.should_retry_on_status.side_effect = lambda status: status == HTTPStatus.UNAUTHORIZED
 
-        thermacell_client = ThermacellClient(
-            username="test@example.com",
-            password="password",
-            base_url=str(client.make_url("")),
-        )
-        thermacell_client._session = client.session
-        thermacell_client._api._session = client.session
-        thermacell_client._api._auth_handler = mock_auth
-        thermacell_client._owns_session = False
-        thermacell_client._auth_handler = mock_auth
+        thermacell_client = await make_client(app, auth=mock_auth)
 
         devices = await thermacell_client.get_devices()
 
@@ -541,81 +412,72 @@ class TestClientAuthenticationIntegration:
 class TestClientInitialization:
     """Test client initialization."""
 
-    def test_init_with_credentials(self) -> None:
-        """Test initialization with username and password."""
-        client = ThermacellClient(
-            username="test@example.com",
-            password="password123",
-        )
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            (
+                {},
+                {
+                    "_base_url": "https://api.iot.thermacell.com",
+                    "_api_root": "https://api.iot.thermacell.com/v1",
+                    "_session": None,
+                    "_owns_session": True,
+                },
+            ),
+            (
+                {"base_url": "https://custom.api.com/"},
+                {"_base_url": "https://custom.api.com", "_api_root": "https://custom.api.com/v1"},
+            ),
+        ],
+        ids=["default_base_url", "custom_base_url"],
+    )
+    def test_init(self, kwargs: dict[str, Any], expected: dict[str, Any]) -> None:
+        """Test initialization creates the auth handler and configures the API layer."""
+        client = ThermacellClient(username="test@example.com", password="password123", **kwargs)
 
         # Credentials are stored in auth handler, base_url in API
         assert client._auth_handler is not None
         assert client._api is not None
-        assert client._api._base_url == "https://api.iot.thermacell.com"
-        assert client._api._session is None
-        assert client._api._owns_session is True
-
-    def test_init_with_custom_base_url(self) -> None:
-        """Test initialization with custom base URL."""
-        client = ThermacellClient(
-            username="test@example.com",
-            password="password123",
-            base_url="https://custom.api.com/",
-        )
-
-        assert client._api._base_url == "https://custom.api.com"
+        for attr, value in expected.items():
+            assert getattr(client._api, attr) == value, attr
 
-    async def test_init_with_session(self, aiohttp_client: TestClient) -> None:
+    async def test_init_with_session(self) -> None:
         """Test initialization with provided session."""
-        app = web.Application()
-        test_client = await aiohttp_client(app)
-
-        client = ThermacellClient(
-            username="test@example.com",
-            password="password123",
-            session=test_client.session,
-        )
-
-        # Session is stored in API layer
-        assert client._api._session == test_client.session
-        assert client._api._owns_session is False
-
-    def test_init_creates_auth_handler(self) -> None:
-        """Test initialization creates auth handler."""
-        client = ThermacellClient(
-            username="test@example.com",
-            password="password123",
-        )
+        async with ClientSession() as session:
+            client = ThermacellClient(
+                username="test@example.com",
+                password="password123",
+                session=session,
+            )
 
-        assert client._auth_handler is not None
-        assert client._api is not None
+            # Session is stored in API layer
+            assert client._api._session is session
+            assert client._api._owns_session is False
 
 
 class TestClientContextManager:
     """Test client context manager."""
 
-    async def test_context_manager_creates_session(self, mock_auth: AsyncMock) -> None:
+    async def test_context_manager_creates_session(self) -> None:
         """Test context manager creates session when not provided."""
         client = ThermacellClient(
             username="test@example.com",
             password="password123",
         )
-        client._auth_handler = mock_auth
-        client._api._auth_handler = mock_auth
+        client._auth_handler = client._api._auth_handler = FakeAuth()
 
         async with client:
             # Session is created in API layer
             assert client._api._session is not None
             assert client._api._owns_session is True
 
-    async def test_context_manager_closes_owned_session(self, mock_auth: AsyncMock) -> None:
+    async def test_context_manager_closes_owned_session(self) -> None:
         """Test context manager closes session it created."""
         client = ThermacellClient(
             username="test@example.com",
             password="password123",
         )
-        client._auth_handler = mock_auth
-        client._api._auth_handler = mock_auth
+        client._auth_handler = client._api._auth_handler = FakeAuth()
 
         async with client:
             # Session is created in API layer
@@ -625,24 +487,17 @@ class TestClientContextManager:
 
         assert session.closed
 
-    async def test_context_manager_does_not_close_provided_session(
-        self,
-        aiohttp_client: TestClient,
-        mock_auth: AsyncMock,
-    ) -> None:
+    async def test_context_manager_does_not_close_provided_session(self) -> None:
         """Test context manager doesn't close injected session."""
-        app = web.Application()
-        test_client = await aiohttp_client(app)
+        async with ClientSession() as session:
+            client = ThermacellClient(
+                username="test@example.com",
+                password="password123",
+                session=session,
+            )
+            client._auth_handler = client._api._auth_handler = FakeAuth()
 
-        client = ThermacellClient(
-            username="test@example.com",
-            password="password123",
-            session=test_client.session,
-        )
-        client._auth_handler = mock_auth
-        client._api._auth_handler = mock_auth
+            async with client:
+                pass
 
-        async with client:
-            pass
-
-        assert not test_client.session.closed
+            assert not session.closed
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import replace
+from datetime import timedelta
 from http import HTTPStatus
-from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -14,21 +17,21 @@ from pythermacell.models import DeviceInfo, DeviceParams, DeviceState, DeviceSta
 
 
 if TYPE_CHECKING:
-    from pythermacell.api import ThermacellAPI
+    from collections.abc import Mapping
 
 
-@pytest.fixture
-def mock_api() -> ThermacellAPI:
-    """Create a mock ThermacellAPI."""
-    api = AsyncMock()
-    # Mock update_node_params to return (200, {})
-    api.update_node_params = AsyncMock(return_value=(HTTPStatus.OK, {}))
-    # Mock get_node_* methods for refresh tests
-    api.get_node_params = AsyncMock(
-        return_value=(
-            HTTPStatus.OK,
-            {
-                "LIV Hub": {
+pytestmark = [pytest.mark.unit, pytest.mark.xdist_group(name="devices")]
+
+_OK = HTTPStatus.OK
+_ERR = HTTPStatus.INTERNAL_SERVER_ERROR
+
+_UPDATE_OK: tuple[int, Mapping[str, Any]] = (_OK, MappingProxyType({}))
+_PARAMS_OK: tuple[int, Mapping[str, Any]] = (
+    _OK,
+    MappingProxyType(
+        {
+            "LIV Hub": MappingProxyType(
+                {
                     "Power": True,
                     "LED Brightness": 80,
                     "LED Hue": 120,
@@ -39,23 +42,171 @@ def mock_api() -> ThermacellAPI:
                     "Error": 0,
                     "Enable Repellers": True,
                 }
-            },
-        )
-    )
-    api.get_node_status = AsyncMock(return_value=(HTTPStatus.OK, {"connectivity": {"connected": True}}))
-    api.get_node_config = AsyncMock(
-        return_value=(
-            HTTPStatus.OK,
-            {
-                "info": {"name": "Test Device", "type": "thermacell-hub", "fw_version": "5.3.3"},
-                "devices": [{"serial_num": "SN123456"}],
-            },
+            )
+        }
+    ),
+)
+_PARAMS_REFRESHED: tuple[int, Mapping[str, Any]] = (
+    _OK,
+    MappingProxyType(
+        {
+            "LIV Hub": MappingProxyType(
+                {
+                    "Power": False,
+                    "LED Brightness": 50,
+                    "LED Hue": 200,
+                    "LED Saturation": 100,
+                    "Refill Life": 50.0,
+                    "System Runtime": 60,
+                    "System Status": 1,
+                    "Error": 0,
+                    "Enable Repellers": False,
+                }
+            )
+        }
+    ),
+)
+_STATUS_OK: tuple[int, Mapping[str, Any]] = (
+    _OK,
+    MappingProxyType({"connectivity": MappingProxyType({"connected": True})}),
+)
+_CONFIG_OK: tuple[int, Mapping[str, Any]] = (
+    _OK,
+    MappingProxyType(
+        {
+            "info": MappingProxyType({"name": "Test Device", "type": "thermacell-hub", "fw_version": "5.3.3"}),
+            "devices": (MappingProxyType({"serial_num": "SN123456"}),),
+        }
+    ),
+)
+
+# What refresh() should derive from the refreshed params plus the canonical
+# status and config; frozen, so one instance serves every run
+_EXPECTED_REFRESHED = DeviceState(
+    info=DeviceInfo(
+        node_id="test-node-123",
+        name="Test Device",
+        model="Thermacell LIV Hub",
+        firmware_version="5.3.3",
+        serial_number="SN123456",
+    ),
+    status=DeviceStatus(node_id="test-node-123", connected=True),
+    params=DeviceParams(
+        power=False,
+        led_power=False,
+        led_brightness=50,
+        led_hue=200,
+        led_saturation=100,
+        refill_life=50.0,
+        system_runtime=360,  # 60 tenths of an hour
+        system_status=1,
+        error=0,
+        enable_repellers=False,
+    ),
+    raw_data={"params": _PARAMS_REFRESHED[1], "status": _STATUS_OK[1], "config": _CONFIG_OK[1]},
+)
+
+
+def _hub_payload(params: dict[str, Any]) -> Mapping[str, Mapping[str, Any]]:
+    """Wrap LIV Hub params in the read-only update_node_params payload shape."""
+    return MappingProxyType({"LIV Hub": MappingProxyType(params)})
+
+
+_PWR_ON = _hub_payload({"Enable Repellers": True})
+_PWR_OFF = _hub_payload({"Enable Repellers": False})
+_LED_0 = _hub_payload({"LED Brightness": 0})
+_LED_50 = _hub_payload({"LED Brightness": 50})
+_LED_100 = _hub_payload({"LED Brightness": 100})
+_LED_COLOR_0_0 = _hub_payload({"LED Hue": 0, "LED Brightness": 0})
+_LED_COLOR_180_75 = _hub_payload({"LED Hue": 180, "LED Brightness": 75})
+_LED_COLOR_360_100 = _hub_payload({"LED Hue": 360, "LED Brightness": 100})
+_REFILL_RESET_1 = _hub_payload({"Refill Reset": 1})
+
+# (method, args, expected payload) run in order against one device
+_POWER_COMMANDS: tuple[tuple[str, tuple[Any, ...], Mapping[str, Any]], ...] = (
+    ("turn_on", (), _PWR_ON),
+    ("turn_off", (), _PWR_OFF),
+    ("set_power", (True,), _PWR_ON),
+    ("set_power", (False,), _PWR_OFF),
+)
+_LED_COMMANDS: tuple[tuple[str, tuple[Any, ...], Mapping[str, Any]], ...] = (
+    ("set_led_power", (True,), _LED_100),
+    ("set_led_power", (False,), _LED_0),
+    ("set_led_brightness", (50,), _LED_50),
+    ("set_led_brightness", (0,), _LED_0),
+    ("set_led_brightness", (100,), _LED_100),
+)
+
+
+class FakeAPI:
+    """Plain stand-in for ThermacellAPI on the device command and refresh paths.
+
+    Far cheaper per call than an ``AsyncMock``. Every call is appended to
+    ``calls`` as ``(method, args)`` and answered from ``responses``, keyed by
+    method name; tests set an entry there to simulate a failing endpoint.
+    """
+
+    __slots__ = ("calls", "responses")
+
+    def __init__(self) -> None:
+        """Initialize the stub with an empty call log and default responses."""
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+        self.responses: dict[str, tuple[int, Any]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the call log and restore the canonical responses."""
+        self.calls.clear()
+        self.responses.update(
+            update_node_params=_UPDATE_OK,
+            get_node_params=_PARAMS_OK,
+            get_node_status=_STATUS_OK,
+            get_node_config=_CONFIG_OK,
         )
-    )
-    return api
+
+    def _respond(self, method: str, *args: Any) -> asyncio.Future[tuple[int, Any]]:
+        """Record a call and return an already-resolved future for its response.
+
+        Awaiting a done future skips the coroutine a plain ``async def``
+        would allocate, and ``asyncio.gather`` uses it without wrapping it
+        in a task.
+        """
+        self.calls.append((method, args))
+        future: asyncio.Future[tuple[int, Any]] = asyncio.get_running_loop().create_future()
+        future.set_result(self.responses[method])
+        return future
+
+    def update_node_params(self, node_id: str, params: dict[str, Any]) -> asyncio.Future[tuple[int, Any]]:
+        """Record a parameter update."""
+        return self._respond("update_node_params", node_id, params)
+
+    def get_node_params(self, node_id: str) -> asyncio.Future[tuple[int, Any]]:
+        """Record a params fetch."""
+        return self._respond("get_node_params", node_id)
+
+    def get_node_status(self, node_id: str) -> asyncio.Future[tuple[int, Any]]:
+        """Record a status fetch."""
+        return self._respond("get_node_status", node_id)
+
+    def get_node_config(self, node_id: str) -> asyncio.Future[tuple[int, Any]]:
+        """Record a config fetch."""
+        return self._respond("get_node_config", node_id)
+
+
+@pytest.fixture(scope="module")
+def shared_fake_api() -> FakeAPI:
+    """Create the fake ThermacellAPI shared by this module's tests."""
+    return FakeAPI()
 
 
 @pytest.fixture
+def fake_api(shared_fake_api: FakeAPI) -> FakeAPI:
+    """Reset the shared fake ThermacellAPI to its canonical responses."""
+    shared_fake_api.reset()
+    return shared_fake_api
+
+
+@pytest.fixture(scope="module")
 def device_info() -> DeviceInfo:
     """Create sample device info."""
     return DeviceInfo(
@@ -67,7 +218,7 @@ def device_info() -> DeviceInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def device_status() -> DeviceStatus:
     """Create sample device status."""
     return DeviceStatus(
@@ -76,7 +227,7 @@ def device_status() -> DeviceStatus:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def device_params() -> DeviceParams:
     """Create sample device parameters."""
     return DeviceParams(
@@ -93,7 +244,7 @@ def device_params() -> DeviceParams:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def device_state(device_info: DeviceInfo, device_status: DeviceStatus, device_params: DeviceParams) -> DeviceState:
     """Create complete device state."""
     return DeviceState(
@@ -104,17 +255,27 @@ def device_state(device_info: DeviceInfo, device_status: DeviceStatus, device_pa
 
 
 @pytest.fixture
-def device(mock_api: ThermacellAPI, device_state: DeviceState) -> ThermacellDevice:
+def device(fake_api: FakeAPI, device_state: DeviceState) -> ThermacellDevice:
     """Create a ThermacellDevice instance."""
-    return ThermacellDevice(api=mock_api, state=device_state)
+    return ThermacellDevice(api=fake_api, state=device_state)
+
+
+@pytest.fixture(scope="class")
+def readonly_device(shared_fake_api: FakeAPI, device_state: DeviceState) -> ThermacellDevice:
+    """Create one ThermacellDevice shared by a test class's read-only tests.
+
+    Tests using it must not call device methods that change state or hit
+    the API; build a separate device for those.
+    """
+    return ThermacellDevice(api=shared_fake_api, state=device_state)
 
 
 class TestDeviceInitialization:
     """Test device initialization."""
 
-    async def test_init_with_state(self, mock_api: ThermacellAPI, device_state: DeviceState) -> None:
+    def test_init_with_state(self, fake_api: FakeAPI, device_state: DeviceState) -> None:
         """Test device initialization with state."""
-        device = ThermacellDevice(api=mock_api, state=device_state)
+        device = ThermacellDevice(api=fake_api, state=device_state)
 
         assert device.node_id == "test-node-123"
         assert device.name == "Test Device"
@@ -122,65 +283,34 @@ class TestDeviceInitialization:
         assert device.firmware_version == "5.3.2"
         assert device.serial_number == "SN123456"
 
-    async def test_properties_from_state(self, device: ThermacellDevice) -> None:
+    def test_properties_from_state(self, readonly_device: ThermacellDevice) -> None:
         """Test that properties correctly reflect state."""
-        assert device.is_online is True
-        assert device.is_powered_on is True
-        assert device.has_error is False
-        assert device.power is True
-        assert device.led_power is True
-        assert device.led_brightness == 80
-        assert device.led_hue == 120
-        assert device.led_saturation == 100
-        assert device.refill_life == 75.5
+        assert readonly_device.is_online is True
+        assert readonly_device.is_powered_on is True
+        assert readonly_device.has_error is False
+        assert readonly_device.power is True
+        assert readonly_device.led_power is True
+        assert readonly_device.led_brightness == 80
+        assert readonly_device.led_hue == 120
+        assert readonly_device.led_saturation == 100
+        assert readonly_device.refill_life == 75.5
 
 
 class TestDevicePowerControl:
     """Test device power control methods."""
 
-    async def test_turn_on(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
-        """Test turning device on."""
-        result = await device.turn_on()
+    async def test_power_commands(self, device: ThermacellDevice, fake_api: FakeAPI) -> None:
+        """Test power commands send the repeller enable flag."""
+        results = [await getattr(device, method)(*args) for method, args, _ in _POWER_COMMANDS]
 
-        assert result is True
-        mock_api.update_node_params.assert_called_once_with(
-            device.node_id,
-            {"LIV Hub": {"Enable Repellers": True}},
-        )
-
-    async def test_turn_off(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
-        """Test turning device off."""
-        result = await device.turn_off()
-
-        assert result is True
-        mock_api.update_node_params.assert_called_once_with(
-            device.node_id,
-            {"LIV Hub": {"Enable Repellers": False}},
-        )
-
-    async def test_set_power_on(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
-        """Test setting power to on."""
-        result = await device.set_power(True)
+        assert results == [True] * len(_POWER_COMMANDS)
+        assert fake_api.calls == [
+            ("update_node_params", (device.node_id, expected_payload)) for _, _, expected_payload in _POWER_COMMANDS
+        ]
 
-        assert result is True
-        mock_api.update_node_params.assert_called_once_with(
-            device.node_id,
-            {"LIV Hub": {"Enable Repellers": True}},
-        )
-
-    async def test_set_power_off(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
-        """Test setting power to off."""
-        result = await device.set_power(False)
-
-        assert result is True
-        mock_api.update_node_params.assert_called_once_with(
-            device.node_id,
-            {"LIV Hub": {"Enable Repellers": False}},
-        )
-
-    async def test_turn_on_failure(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
+    async def test_turn_on_failure(self, device: ThermacellDevice, fake_api: FakeAPI) -> None:
         """Test turn on when API call fails."""
-        mock_api.update_node_params.return_value = (HTTPStatus.INTERNAL_SERVER_ERROR, None)
+        fake_api.responses["update_node_params"] = (_ERR, None)
 
         result = await device.turn_on()
 
@@ -190,126 +320,68 @@ class TestDevicePowerControl:
 class TestLEDControl:
     """Test LED control methods."""
 
-    async def test_set_led_power_on(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
-        """Test turning LED on."""
-        result = await device.set_led_power(True)
-
-        assert result is True
-        mock_api.update_node_params.assert_called_once_with(
-            device.node_id,
-            {"LIV Hub": {"LED Brightness": 100}},
-        )
-
-    async def test_set_led_power_off(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
-        """Test turning LED off."""
-        result = await device.set_led_power(False)
-
-        assert result is True
-        mock_api.update_node_params.assert_called_once_with(
-            device.node_id,
-            {"LIV Hub": {"LED Brightness": 0}},
-        )
-
-    async def test_set_led_brightness_valid(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
-        """Test setting LED brightness with valid value."""
-        result = await device.set_led_brightness(50)
-
-        assert result is True
-        mock_api.update_node_params.assert_called_once_with(
-            device.node_id,
-            {"LIV Hub": {"LED Brightness": 50}},
-        )
-
-    async def test_set_led_brightness_min(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
-        """Test setting LED brightness to minimum."""
-        result = await device.set_led_brightness(0)
-
-        assert result is True
-        mock_api.update_node_params.assert_called_once_with(
-            device.node_id,
-            {"LIV Hub": {"LED Brightness": 0}},
-        )
-
-    async def test_set_led_brightness_max(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
-        """Test setting LED brightness to maximum."""
-        result = await device.set_led_brightness(100)
-
-        assert result is True
-        mock_api.update_node_params.assert_called_once_with(
-            device.node_id,
-            {"LIV Hub": {"LED Brightness": 100}},
-        )
-
-    async def test_set_led_brightness_invalid_low(self, device: ThermacellDevice) -> None:
-        """Test setting LED brightness below minimum raises error."""
-        with pytest.raises(InvalidParameterError) as exc_info:
-            await device.set_led_brightness(-1)
-
-        assert "brightness" in str(exc_info.value).lower()
-        assert exc_info.value.parameter_name == "brightness"
-        assert exc_info.value.value == -1
-
-    async def test_set_led_brightness_invalid_high(self, device: ThermacellDevice) -> None:
-        """Test setting LED brightness above maximum raises error."""
-        with pytest.raises(InvalidParameterError) as exc_info:
-            await device.set_led_brightness(101)
+    async def test_led_commands(self, device: ThermacellDevice, fake_api: FakeAPI) -> None:
+        """Test LED power and brightness commands send the brightness value."""
+        results = [await getattr(device, method)(*args) for method, args, _ in _LED_COMMANDS]
 
-        assert "brightness" in str(exc_info.value).lower()
-        assert exc_info.value.parameter_name == "brightness"
-        assert exc_info.value.value == 101
+        assert results == [True] * len(_LED_COMMANDS)
+        assert fake_api.calls == [
+            ("update_node_params", (device.node_id, expected_payload)) for _, _, expected_payload in _LED_COMMANDS
+        ]
 
-    async def test_set_led_color_valid(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
+    @pytest.mark.parametrize(
+        ("hue", "brightness", "expected_payload"),
+        [(0, 0, _LED_COLOR_0_0), (180, 75, _LED_COLOR_180_75), (360, 100, _LED_COLOR_360_100)],
+        ids=["min", "mid", "max"],
+    )
+    async def test_set_led_color_valid(
+        self,
+        device: ThermacellDevice,
+        fake_api: FakeAPI,
+        hue: int,
+        brightness: int,
+        expected_payload: Mapping[str, Any],
+    ) -> None:
         """Test setting LED color with valid hue and brightness values.
 
         Note: Saturation is not supported - always assumed to be 100%.
         """
-        result = await device.set_led_color(hue=180, brightness=75)
-
-        assert result is True
-        mock_api.update_node_params.assert_called_once_with(
-            device.node_id,
-            {
-                "LIV Hub": {
-                    "LED Hue": 180,
-                    "LED Brightness": 75,
-                }
-            },
-        )
-
-    async def test_set_led_color_min_values(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
-        """Test setting LED color with minimum values."""
-        result = await device.set_led_color(hue=0, brightness=0)
+        result = await device.set_led_color(hue=hue, brightness=brightness)
 
         assert result is True
-        mock_api.update_node_params.assert_called_once()
-
-    async def test_set_led_color_max_values(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
-        """Test setting LED color with maximum values."""
-        result = await device.set_led_color(hue=360, brightness=100)
-
-        assert result is True
-        mock_api.update_node_params.assert_called_once()
-
-    async def test_set_led_color_invalid_hue_low(self, device: ThermacellDevice) -> None:
-        """Test setting LED color with hue below minimum."""
-        with pytest.raises(InvalidParameterError) as exc_info:
-            await device.set_led_color(hue=-1, brightness=50)
-
-        assert exc_info.value.parameter_name == "hue"
-        assert exc_info.value.value == -1
-
-    async def test_set_led_color_invalid_hue_high(self, device: ThermacellDevice) -> None:
-        """Test setting LED color with hue above maximum."""
+        assert fake_api.calls == [("update_node_params", (device.node_id, expected_payload))]
+
+    @pytest.mark.parametrize(
+        ("method", "kwargs", "parameter_name", "value"),
+        [
+            ("set_led_brightness", {"brightness": -1}, "brightness", -1),
+            ("set_led_brightness", {"brightness": 101}, "brightness", 101),
+            ("set_led_color", {"hue": -1, "brightness": 50}, "hue", -1),
+            ("set_led_color", {"hue": 361, "brightness": 50}, "hue", 361),
+        ],
+        ids=["brightness_low", "brightness_high", "hue_low", "hue_high"],
+    )
+    async def test_invalid_parameter(
+        self,
+        device: ThermacellDevice,
+        method: str,
+        kwargs: dict[str, int],
+        parameter_name: str,
+        value: int,
+    ) -> None:
+        """Test out-of-range LED values raise InvalidParameterError."""
         with pytest.raises(InvalidParameterError) as exc_info:
-            await device.set_led_color(hue=361, brightness=50)
+            await getattr(device, method)(**kwargs)
 
-        assert exc_info.value.parameter_name == "hue"
+        assert parameter_name in str(exc_info.value).lower()
+        assert exc_info.value.parameter_name == parameter_name
+        assert exc_info.value.value == value
 
 
 class TestRefillControl:
     """Test refill-related methods."""
 
-    async def test_reset_refill(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
+    async def test_reset_refill(self, device: ThermacellDevice, fake_api: FakeAPI) -> None:
         """Test resetting refill life to 100%.
 
         Uses default refill type 1 (100 Hour - Blue Cap).
@@ -317,46 +389,16 @@ class TestRefillControl:
         result = await device.reset_refill()
 
         assert result is True
-        mock_api.update_node_params.assert_called_once_with(
-            device.node_id,
-            {"LIV Hub": {"Refill Reset": 1}},
-        )
+        assert fake_api.calls == [("update_node_params", (device.node_id, _REFILL_RESET_1))]
 
 
 class TestDeviceRefresh:
     """Test device state refresh."""
 
-    async def test_refresh_success(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
+    async def test_refresh_success(self, device: ThermacellDevice, fake_api: FakeAPI) -> None:
         """Test refreshing device state."""
-        # Mock the three API calls that refresh() makes
-        mock_api.get_node_params = AsyncMock(
-            return_value=(
-                HTTPStatus.OK,
-                {
-                    "LIV Hub": {
-                        "Power": False,
-                        "LED Brightness": 50,
-                        "LED Hue": 200,
-                        "LED Saturation": 100,
-                        "Refill Life": 50.0,
-                        "System Runtime": 60,
-                        "System Status": 1,
-                        "Error": 0,
-                        "Enable Repellers": False,
-                    }
-                },
-            )
-        )
-        mock_api.get_node_status = AsyncMock(return_value=(HTTPStatus.OK, {"connectivity": {"connected": True}}))
-        mock_api.get_node_config = AsyncMock(
-            return_value=(
-                HTTPStatus.OK,
-                {
-                    "info": {"name": "Test Device", "type": "thermacell-hub", "fw_version": "5.3.3"},
-                    "devices": [{"serial_num": "SN123456"}],
-                },
-            )
-        )
+        # Serve refreshed params; status and config keep their canonical responses
+        fake_api.responses["get_node_params"] = _PARAMS_REFRESHED
 
         result = await device.refresh()
 
@@ -364,13 +406,16 @@ class TestDeviceRefresh:
         assert device.firmware_version == "5.3.3"
         assert device.power is False
         assert device.led_brightness == 50
-        mock_api.get_node_params.assert_called_once_with(device.node_id)
-        mock_api.get_node_status.assert_called_once_with(device.node_id)
-        mock_api.get_node_config.assert_called_once_with(device.node_id)
-
-    async def test_refresh_failure(self, device: ThermacellDevice, mock_api: ThermacellAPI) -> None:
+        assert device._state == _EXPECTED_REFRESHED
+        assert fake_api.calls == [
+            ("get_node_params", (device.node_id,)),
+            ("get_node_status", (device.node_id,)),
+            ("get_node_config", (device.node_id,)),
+        ]
+
+    async def test_refresh_failure(self, device: ThermacellDevice, fake_api: FakeAPI) -> None:
         """Test refresh when API call fails."""
-        mock_api.get_node_params = AsyncMock(return_value=(HTTPStatus.INTERNAL_SERVER_ERROR, None))
+        fake_api.responses["get_node_params"] = (_ERR, None)
 
         result = await device.refresh()
 
@@ -380,63 +425,56 @@ class TestDeviceRefresh:
 class TestDeviceStateProperties:
     """Test device state property accessors."""
 
-    async def test_offline_device(self, mock_api: ThermacellAPI, device_state: DeviceState) -> None:
+    def test_offline_device(self, fake_api: FakeAPI, device_state: DeviceState) -> None:
         """Test properties when device is offline."""
-        device_state.status.connected = False
-        device = ThermacellDevice(api=mock_api, state=device_state)
+        state = replace(device_state, status=replace(device_state.status, connected=False))
+        device = ThermacellDevice(api=fake_api, state=state)
 
         assert device.is_online is False
 
-    async def test_powered_off_device(self, mock_api: ThermacellAPI, device_state: DeviceState) -> None:
+    def test_powered_off_device(self, fake_api: FakeAPI, device_state: DeviceState) -> None:
         """Test properties when device is powered off."""
-        device_state.params.power = False
-        device = ThermacellDevice(api=mock_api, state=device_state)
+        state = replace(device_state, params=replace(device_state.params, power=False))
+        device = ThermacellDevice(api=fake_api, state=state)
 
         assert device.is_powered_on is False
         assert device.power is False
 
-    async def test_device_with_error(self, mock_api: ThermacellAPI, device_state: DeviceState) -> None:
+    def test_device_with_error(self, fake_api: FakeAPI, device_state: DeviceState) -> None:
         """Test properties when device has error."""
-        device_state.params.error = 5
-        device = ThermacellDevice(api=mock_api, state=device_state)
+        state = replace(device_state, params=replace(device_state.params, error=5))
+        device = ThermacellDevice(api=fake_api, state=state)
 
         assert device.has_error is True
         assert device.error == 5
 
-    async def test_device_without_error(self, mock_api: ThermacellAPI, device_state: DeviceState) -> None:
+    def test_device_without_error(self, readonly_device: ThermacellDevice) -> None:
         """Test properties when device has no error."""
-        device_state.params.error = 0
-        device = ThermacellDevice(api=mock_api, state=device_state)
-
-        assert device.has_error is False
-        assert device.error == 0
+        assert readonly_device.has_error is False
+        assert readonly_device.error == 0
 
-    async def test_none_parameter_values(self, mock_api: ThermacellAPI, device_state: DeviceState) -> None:
+    def test_none_parameter_values(self, fake_api: FakeAPI, device_state: DeviceState) -> None:
         """Test properties when parameters are None."""
-        device_state.params.power = None
-        device_state.params.led_brightness = None
-        device = ThermacellDevice(api=mock_api, state=device_state)
+        state = replace(device_state, params=replace(device_state.params, power=None, led_brightness=None))
+        device = ThermacellDevice(api=fake_api, state=state)
 
         assert device.power is None
         assert device.led_brightness is None
         assert device.is_powered_on is False  # None treated as False
 
-    async def test_state_age_seconds(self, mock_api: ThermacellAPI, device_state: DeviceState) -> None:
+    async def test_state_age_seconds(self, fake_api: FakeAPI, device_state: DeviceState) -> None:
         """Test state_age_seconds property tracks time since last refresh."""
-        import asyncio
-
-        device = ThermacellDevice(api=mock_api, state=device_state)
+        device = ThermacellDevice(api=fake_api, state=device_state)
 
         # Immediately after creation, age should be near 0
         initial_age = device.state_age_seconds
         assert initial_age >= 0
         assert initial_age < 0.1  # Should be very recent
 
-        # Wait a bit and check age has increased
-        await asyncio.sleep(0.2)
+        # Age the state by backdating the last refresh instead of sleeping
+        device._last_refresh -= timedelta(seconds=0.2)
         age_after_wait = device.state_age_seconds
         assert age_after_wait >= 0.2
-        assert age_after_wait < 0.3  # Allow some margin
 
         # After refresh, age should reset
         await device.refresh()
@@ -448,16 +486,16 @@ class TestDeviceStateProperties:
 class TestDeviceRepresentation:
     """Test device string representation."""
 
-    async def test_str_representation(self, device: ThermacellDevice) -> None:
+    def test_str_representation(self, readonly_device: ThermacellDevice) -> None:
         """Test string representation of device."""
-        result = str(device)
+        result = str(readonly_device)
 
         assert "Test Device" in result
         assert "test-node-123" in result
 
-    async def test_repr_representation(self, device: ThermacellDevice) -> None:
+    def test_repr_representation(self, readonly_device: ThermacellDevice) -> None:
         """Test repr representation of device."""
-        result = repr(device)
+        result = repr(readonly_device)
 
         assert "ThermacellDevice" in result
         assert "test-node-123" in result
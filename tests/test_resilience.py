@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import asyncio
 from http import HTTPStatus
-from unittest.mock import MagicMock
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -17,6 +17,13 @@ from pythermacell.resilience import (
 )
 
 
+if TYPE_CHECKING:
+    from tests.conftest import FakeClock
+
+
+pytestmark = pytest.mark.unit
+
+
 class TestCircuitBreaker:
     """Test CircuitBreaker pattern."""
 
@@ -64,29 +71,13 @@ class TestCircuitBreaker:
         assert breaker.failure_count == 0
         assert breaker.state == CircuitState.CLOSED
 
-    async def test_enters_half_open_after_timeout(self) -> None:
-        """Test that circuit enters HALF_OPEN state after recovery timeout."""
-        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.1)
-
-        # Open the circuit
-        breaker.record_failure(Exception("test"))
-        breaker.record_failure(Exception("test"))
-
-        assert breaker.state == CircuitState.OPEN
-
-        # Wait for recovery timeout
-        await asyncio.sleep(0.15)
-
-        # Check state - should be HALF_OPEN now
-        assert breaker.state == CircuitState.HALF_OPEN
-        assert breaker.can_execute() is True
-
-    async def test_half_open_closes_after_success_threshold(self) -> None:
+    def test_half_open_closes_after_success_threshold(self, fake_clock: FakeClock) -> None:
         """Test that HALF_OPEN closes after success threshold."""
         breaker = CircuitBreaker(
             failure_threshold=2,
             recovery_timeout=0.1,
             success_threshold=2,
+            time_func=fake_clock,
         )
 
         # Open the circuit
@@ -94,8 +85,8 @@ class TestCircuitBreaker:
         breaker.record_failure(Exception("test"))
         assert breaker.state == CircuitState.OPEN
 
-        # Wait for recovery
-        await asyncio.sleep(0.15)
+        # Move past the recovery timeout
+        fake_clock.advance(0.15)
         assert breaker.state == CircuitState.HALF_OPEN
 
         # Record successes
@@ -105,22 +96,36 @@ class TestCircuitBreaker:
         breaker.record_success()
         assert breaker.state == CircuitState.CLOSED  # Now closed
 
-    async def test_half_open_reopens_on_failure(self) -> None:
+    def test_half_open_reopens_on_failure(self, fake_clock: FakeClock) -> None:
         """Test that HALF_OPEN immediately reopens on any failure."""
-        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.1)
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.1, time_func=fake_clock)
 
         # Open the circuit
         breaker.record_failure(Exception("test"))
         breaker.record_failure(Exception("test"))
 
-        # Wait for recovery
-        await asyncio.sleep(0.15)
+        # Move past the recovery timeout
+        fake_clock.advance(0.15)
         assert breaker.state == CircuitState.HALF_OPEN
 
         # Any failure in HALF_OPEN should reopen circuit
         breaker.record_failure(Exception("test"))
         assert breaker.state == CircuitState.OPEN
 
+    def test_enters_half_open_with_injected_clock(self, fake_clock: FakeClock) -> None:
+        """Test that recovery timeout is measured with the injected clock."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0, time_func=fake_clock)
+
+        breaker.record_failure(Exception("test"))
+        assert breaker.state == CircuitState.OPEN
+
+        fake_clock.advance(59.9)
+        assert breaker.state == CircuitState.OPEN
+
+        fake_clock.advance(0.1)
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.can_execute() is True
+
     def test_reset_clears_state(self) -> None:
         """Test that reset clears all circuit breaker state."""
         breaker = CircuitBreaker(failure_threshold=2)
@@ -168,18 +173,12 @@ class TestExponentialBackoff:
         delay = backoff.calculate_delay(0)
         assert delay == 1.0
 
-    def test_exponential_growth(self) -> None:
-        """Test that delays grow exponentially."""
-        backoff = ExponentialBackoff(
-            base_delay=1.0,
-            exponential_base=2.0,
-            jitter=False,
-        )
+    @pytest.mark.parametrize(("attempt", "expected"), [(0, 1.0), (1, 2.0), (2, 4.0), (3, 8.0)])
+    def test_delay_progression(self, attempt: int, expected: float) -> None:
+        """Test that delays grow exponentially (base_delay * 2^attempt without jitter)."""
+        backoff = ExponentialBackoff(base_delay=1.0, exponential_base=2.0, max_delay=60.0, jitter=False)
 
-        assert backoff.calculate_delay(0) == 1.0  # 1 * 2^0
-        assert backoff.calculate_delay(1) == 2.0  # 1 * 2^1
-        assert backoff.calculate_delay(2) == 4.0  # 1 * 2^2
-        assert backoff.calculate_delay(3) == 8.0  # 1 * 2^3
+        assert backoff.calculate_delay(attempt) == expected
 
     def test_respects_max_delay(self) -> None:
         """Test that delay is capped at max_delay."""
@@ -205,6 +204,29 @@ class TestExponentialBackoff:
         # Delays should not all be the same (very unlikely with jitter)
         assert len(set(delays)) > 1
 
+    def test_jitter_scales_delay_by_random_fraction(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that jitter draws uniformly between zero and the calculated delay."""
+        fractions = iter([0.1, 0.4, 0.7, 0.9])
+        monkeypatch.setattr(
+            "pythermacell.resilience.random.uniform",
+            lambda low, high: low + (high - low) * next(fractions),
+        )
+        backoff = ExponentialBackoff(base_delay=10.0, jitter=True)
+
+        delays = [backoff.calculate_delay(1) for _ in range(4)]
+
+        # Jitter draws uniformly from [0, base * exponential_base^1] = [0, 20]
+        assert delays == pytest.approx([2.0, 8.0, 14.0, 18.0])
+
+    async def test_sleep_uses_injected_sleeper(self) -> None:
+        """Test that sleep() delegates to the injected sleep function."""
+        sleeper = AsyncMock()
+        backoff = ExponentialBackoff(sleep_func=sleeper)
+
+        await backoff.sleep(1.5)
+
+        sleeper.assert_awaited_once_with(1.5)
+
     def test_max_retries_property(self) -> None:
         """Test that max_retries property works."""
         backoff = ExponentialBackoff(max_retries=7)
@@ -254,6 +276,21 @@ class TestRateLimiter:
         delay = limiter.get_retry_delay(HTTPStatus.TOO_MANY_REQUESTS, "30")
         assert delay == 10.0  # Uses default, not header value
 
+    @pytest.mark.parametrize(
+        ("status", "retry_after", "expected"),
+        [
+            (HTTPStatus.TOO_MANY_REQUESTS, None, 60.0),  # No Retry-After header uses default delay
+            (HTTPStatus.TOO_MANY_REQUESTS, "30", 30.0),  # Retry-After parsed as seconds
+            (HTTPStatus.TOO_MANY_REQUESTS, "500", 300.0),  # Retry-After capped at max_retry_delay
+            (HTTPStatus.OK, "30", 0.0),  # Non-429 status never waits
+        ],
+    )
+    def test_get_retry_delay_calculation(self, status: int, retry_after: str | None, expected: float) -> None:
+        """Test retry delay calculation across header and status combinations."""
+        limiter = RateLimiter(respect_retry_after=True, default_retry_delay=60.0, max_retry_delay=300.0)
+
+        assert limiter.get_retry_delay(status, retry_after) == expected
+
     def test_get_retry_delay_handles_invalid_header(self) -> None:
         """Test that invalid Retry-After header falls back to default."""
         limiter = RateLimiter(default_retry_delay=20.0)